@@ -1,73 +1,54 @@
-import copy
-import math
 import pandas as pd
 import random
 import numpy as np
 import streamlit as st
 from streamlit_option_menu import option_menu
 import io
+import json
+import os
+from jobshop import (
+    avalia,
+    gerar_problema_aleatorio,
+    gerar_solucao_inicial_aleatoria,
+    subida_de_encosta,
+    subida_de_encosta_com_tentativas,
+    tempera_simulada,
+    busca_tabu,
+    algoritmo_genetico_simples,
+    algoritmo_genetico_ilhas,
+    como_problema,
+    executar_comparativo,
+    iniciar_execucao,
+    obter_execucao,
+    descartar_execucao,
+    Perfil,
+)
 
 # ==============================
 # FUNÇÕES BÁSICAS EXISTENTES
 # ==============================
 
-def resetar_variavel():
-    if "solucao_inicial" in st.session_state:
-        del st.session_state["solucao_inicial"]
-
-def gerar_problema_aleatorio(num_jobs, num_maquinas):
-    maquinas = [f"M{i+1}" for i in range(num_maquinas)]
-    dados = []
+OPCOES_VIZINHANCA = {
+    "Troca aleatória": "aleatoria",
+    "N5 (caminho crítico)": "n5",
+    "N7 (caminho crítico)": "n7",
+}
 
-    for _ in range(num_jobs):
-        ordem_maquinas = random.sample(maquinas, len(maquinas))
-        operacoes = [(maquina, random.randint(1, 10)) for maquina in ordem_maquinas]
-        dados.append(operacoes)
+OPCOES_SELECAO = {
+    "Roleta": "roleta",
+    "Torneio": "torneio",
+    "Ranking": "ranking",
+}
 
-    return dados
+OPCOES_CRUZAMENTO = {
+    "JOX (ordem por job)": "jox",
+    "POX (precedência de operações)": "pox",
+    "Ponto único": "ponto_unico",
+}
 
-def gerar_solucao_inicial_aleatoria(dados, tamanho_problema):
-    disponibilidade_maquinas = {}
-    cronograma = []
-
-    for job in dados:
-        for maquina, _ in job:
-            disponibilidade_maquinas[maquina] = 0
-
-    todas_operacoes = []
-    for job_id, operacoes in enumerate(dados, start=1):
-        for op_index, (maquina, duracao) in enumerate(operacoes, start=1):
-            todas_operacoes.append((job_id, op_index, maquina, duracao))
-
-    random.shuffle(todas_operacoes)
-
-    tempo_jobs = {job_id: 0 for job_id in range(1, len(dados)+1)}
-
-    for job_id, op_index, maquina, duracao in todas_operacoes:
-        inicio = max(tempo_jobs[job_id], disponibilidade_maquinas[maquina])
-        fim = inicio + duracao
-        disponibilidade_maquinas[maquina] = fim
-        tempo_jobs[job_id] = fim
-
-        cronograma.append({
-            "Job": f"J{job_id}",
-            "Operação": f"Op{op_index}",
-            "Máquina": maquina,
-            "Início": inicio,
-            "Fim": fim
-        })
-    
-    dados_formatados = [[f"{maquina} - {tempo}" for maquina, tempo in linha] for linha in dados]
-    df = pd.DataFrame(dados_formatados, columns=[f"Op{i+1}" for i in range(len(dados[0]))], index=[f"J{i+1}" for i in range(tamanho_problema)])
-
-    return cronograma, df
-
-def avalia(cronograma):
-    if not cronograma:
-        return 0
-    tempos_finais = [op["Fim"] for op in cronograma]
-    makespan = max(tempos_finais)
-    return makespan
+def resetar_variavel():
+    if "solucao_inicial" in st.session_state:
+        del st.session_state["solucao_inicial"]
 
 def mostrar_solucao_fixa(dados):
     dados_formatados = [[f"{maquina} - {tempo}" for maquina, tempo in linha] for linha in dados]
@@ -123,121 +104,6 @@ def mostrar_solucao_inicial_aleatoria(dados, cronograma, df):
     st.session_state.makespan_inicial = makespan
     st.session_state.df = df
 
-def construir_lista_por_maquina(dados):
-    maquina_ops = {}
-    for job_id, operacoes in enumerate(dados):
-        for op_index, (maquina, duracao) in enumerate(operacoes):
-            if maquina not in maquina_ops:
-                maquina_ops[maquina] = []
-            maquina_ops[maquina].append({
-                "job_id": job_id,
-                "op_index": op_index,
-                "duracao": duracao
-            })
-    return maquina_ops
-
-def gerar_vizinho(maquina_ops):
-    novo = copy.deepcopy(maquina_ops)
-    maquina = random.choice(list(novo.keys()))
-    if len(novo[maquina]) >= 2:
-        i, j = random.sample(range(len(novo[maquina])), 2)
-        novo[maquina][i], novo[maquina][j] = novo[maquina][j], novo[maquina][i]
-    return novo
-
-def construir_cronograma(dados, maquina_ops):
-    disponibilidade_maquinas = {m: 0 for m in maquina_ops}
-    disponibilidade_jobs = [0] * len(dados)
-    cronograma = []
-
-    for maquina, ops in maquina_ops.items():
-        for op in ops:
-            job_id = op["job_id"]
-            op_index = op["op_index"]
-            duracao = op["duracao"]
-
-            inicio = max(disponibilidade_maquinas[maquina], disponibilidade_jobs[job_id])
-            fim = inicio + duracao
-
-            disponibilidade_maquinas[maquina] = fim
-            disponibilidade_jobs[job_id] = fim
-
-            cronograma.append({
-                "Job": f"J{job_id+1}",
-                "Operação": f"Op{op_index+1}",
-                "Máquina": maquina,
-                "Início": inicio,
-                "Fim": fim
-            })
-    return cronograma
-
-def subida_de_encosta(dados, solucao_inicial):
-    maquina_ops = construir_lista_por_maquina(dados)
-    melhor_cronograma = solucao_inicial
-    melhor_makespan = avalia(melhor_cronograma)
-
-    while True:
-        vizinho_ops = gerar_vizinho(maquina_ops)
-        cronograma_vizinho = construir_cronograma(dados, vizinho_ops)
-        makespan_vizinho = avalia(cronograma_vizinho)
-
-        if makespan_vizinho < melhor_makespan:
-            maquina_ops = vizinho_ops
-            melhor_cronograma = cronograma_vizinho
-            melhor_makespan = makespan_vizinho
-        else:
-            break
-
-    return melhor_cronograma, melhor_makespan
-
-def subida_de_encosta_com_tentativas(dados, solucao_inicial, tmax=3):
-    maquina_ops = construir_lista_por_maquina(dados)
-    melhor_cronograma = solucao_inicial
-    melhor_makespan = avalia(melhor_cronograma)
-
-    t = 0
-    while t < tmax:
-        vizinho_ops = gerar_vizinho(maquina_ops)
-        cronograma_vizinho = construir_cronograma(dados, vizinho_ops)
-        makespan_vizinho = avalia(cronograma_vizinho)
-
-        if makespan_vizinho < melhor_makespan:
-            maquina_ops = vizinho_ops
-            melhor_cronograma = cronograma_vizinho
-            melhor_makespan = makespan_vizinho
-            t = 0
-        else:
-            t += 1
-
-    return melhor_cronograma, melhor_makespan
-
-def tempera_simulada(dados, solucao_inicial, temp_inicial=500, temp_final=0.1, fator=0.8):
-    maquina_ops = construir_lista_por_maquina(dados)
-    melhor_cronograma = solucao_inicial
-    melhor_makespan = avalia(melhor_cronograma)
-    atual_makespan = melhor_makespan
-    temperatura = temp_inicial
-
-    while temperatura > temp_final:
-        vizinho_ops = gerar_vizinho(maquina_ops)
-        cronograma_vizinho = construir_cronograma(dados, vizinho_ops)
-        makespan_vizinho = avalia(cronograma_vizinho)
-
-        delta = makespan_vizinho - atual_makespan
-
-        if delta < 0:
-            atual_makespan = makespan_vizinho
-            if makespan_vizinho < melhor_makespan:
-                melhor_cronograma = cronograma_vizinho
-                melhor_makespan = makespan_vizinho
-        else:
-            prob = math.exp(-delta / temperatura)
-            if random.random() < prob:
-                atual_makespan = makespan_vizinho
-
-        temperatura *= fator
-
-    return melhor_cronograma, melhor_makespan
-
 def criar_arquivo_download(cronograma, nome_arquivo="cronograma_jobshop"):
     """Cria um arquivo CSV para download formatado corretamente"""
     df = pd.DataFrame(cronograma)
@@ -246,196 +112,39 @@ def criar_arquivo_download(cronograma, nome_arquivo="cronograma_jobshop"):
     buffer.seek(0)
     return buffer.getvalue()
 
-# ==============================
-# ALGORITMO GENÉTICO
-# ==============================
-
-def pop_ini_jobshop(dados, tamanho_pop):
-    n_jobs = len(dados)
-    n_ops = [len(job) for job in dados]
-    cromossomo_base = []
-    for j, ops in enumerate(n_ops):
-        cromossomo_base += [j] * ops  # cada job aparece tantas vezes quanto suas operações
-    
-    pop = []
-    for _ in range(tamanho_pop):
-        individuo = cromossomo_base.copy()
-        random.shuffle(individuo)
-        pop.append(individuo)
-    
-    return pop
-
-
-def decodificar_individuo_simples(individuo, dados):
-    """
-    Decodifica um indivíduo em cronograma detalhado.
-    Retorna lista de dicionários: Job, Operação, Máquina, Início, Fim
-    """
-    cronograma = []
-    tempo_maquinas = {maq: 0 for maq in {op[0] for job in dados for op in job}}
-    tempo_jobs = {j: 0 for j in range(len(dados))}
-    contagem_ops = {j: 0 for j in range(len(dados))}
-    
-    # 1. Percorre cromossomo
-    for job_idx in individuo:
-        op_idx = contagem_ops[job_idx]
-        if op_idx < len(dados[job_idx]):
-            maquina, duracao = dados[job_idx][op_idx]
-            inicio = max(tempo_maquinas[maquina], tempo_jobs[job_idx])
-            fim = inicio + duracao
-            tempo_maquinas[maquina] = fim
-            tempo_jobs[job_idx] = fim
-            contagem_ops[job_idx] += 1
-            cronograma.append({
-                "Job": f"J{job_idx+1}",
-                "Operação": f"Op{op_idx+1}",
-                "Máquina": maquina,
-                "Início": inicio,
-                "Fim": fim
-            })
-    
-    # 2. Força inclusão das operações restantes (se o cromossomo não percorreu todas)
-    for job_idx, job in enumerate(dados):
-        while contagem_ops[job_idx] < len(job):
-            op_idx = contagem_ops[job_idx]
-            maquina, duracao = job[op_idx]
-            inicio = max(tempo_maquinas[maquina], tempo_jobs[job_idx])
-            fim = inicio + duracao
-            tempo_maquinas[maquina] = fim
-            tempo_jobs[job_idx] = fim
-            contagem_ops[job_idx] += 1
-            cronograma.append({
-                "Job": f"J{job_idx+1}",
-                "Operação": f"Op{op_idx+1}",
-                "Máquina": maquina,
-                "Início": inicio,
-                "Fim": fim
-            })
-    
-    return cronograma
-
-
-def aptidao_jobshop_simples(pop, dados):
-    """Calcula aptidão (versão simplificada)"""
-    fit = []
-    for individuo in pop:
-        cronograma = decodificar_individuo_simples(individuo, dados)
-        makespan = avalia(cronograma)
-        # Quanto menor o makespan, melhor (usar 1/makespan)
-        if makespan > 0:
-            fit.append(1.0 / makespan)
-        else:
-            fit.append(0.0)
-    
-    # Normalizar
-    soma = sum(fit)
-    if soma > 0:
-        fit = [f / soma for f in fit]
-    else:
-        fit = [1.0 / len(fit) for _ in fit]
-    
-    return fit
-
-def selecao_roleta_simples(fit):
-    """Seleção por roleta (versão simplificada)"""
-    if not fit:
-        return 0
-    
-    soma = sum(fit)
-    if soma == 0:
-        return random.randint(0, len(fit) - 1)
-    
-    ale = random.random() * soma
-    acumulado = 0
-    
-    for i, f in enumerate(fit):
-        acumulado += f
-        if acumulado >= ale:
-            return i
-    
-    return len(fit) - 1
-
-def cruzamento_ponto_unico(pai1, pai2):
-    """Cruzamento em ponto único"""
-    n = len(pai1)
-    
-    if n < 2:
-        return pai1.copy(), pai2.copy()
-    
-    ponto = random.randint(1, n - 1)
-    
-    filho1 = pai1[:ponto] + pai2[ponto:]
-    filho2 = pai2[:ponto] + pai1[ponto:]
-    
-    return filho1, filho2
-
-def mutacao_troca_simples(individuo):
-    """Mutação por troca de posições"""
-    n = len(individuo)
-    
-    if n < 2:
-        return individuo
-    
-    # Criar cópia
-    mutado = individuo.copy()
-    
-    # Escolher duas posições diferentes
-    pos1, pos2 = random.sample(range(n), 2)
-    
-    # Trocar
-    mutado[pos1], mutado[pos2] = mutado[pos2], mutado[pos1]
-    
-    return mutado
-
-def algoritmo_genetico_simples(dados, tp=30, ng=50, tc=0.8, tm=0.1, ig=0.2):
-    pop = pop_ini_jobshop(dados, tp)
-    fit = aptidao_jobshop_simples(pop, dados)
-
-    melhor_individuo = None
-    melhor_makespan = float('inf')
-    historico = []
-
-    for geracao in range(ng):
-        nova_pop = []
-        while len(nova_pop) < tp:
-            pai1_idx = selecao_roleta_simples(fit)
-            pai2_idx = selecao_roleta_simples(fit)
-            pai1, pai2 = pop[pai1_idx], pop[pai2_idx]
-
-            if random.random() < tc:
-                filho1, filho2 = cruzamento_ponto_unico(pai1, pai2)
-            else:
-                filho1, filho2 = pai1.copy(), pai2.copy()
-
-            if random.random() < tm:
-                filho1 = mutacao_troca_simples(filho1)
-            if random.random() < tm:
-                filho2 = mutacao_troca_simples(filho2)
-
-            nova_pop.append(filho1)
-            if len(nova_pop) < tp:
-                nova_pop.append(filho2)
-
-        # >>> Aplicar elitismo com IG
-        elite = int(ig * tp)
-        pop_ordenada = [x for _, x in sorted(zip(fit, pop), key=lambda z: z[0], reverse=True)]
-        fit_desc = aptidao_jobshop_simples(nova_pop, dados)
-        desc_ordenada = [x for _, x in sorted(zip(fit_desc, nova_pop), key=lambda z: z[0], reverse=True)]
-        pop = pop_ordenada[:elite] + desc_ordenada[:tp-elite]
-        fit = aptidao_jobshop_simples(pop, dados)
-
-        # Atualizar melhor
-        for individuo in pop:
-            cronograma = decodificar_individuo_simples(individuo, dados)
-            makespan = avalia(cronograma)
-            if makespan < melhor_makespan:
-                melhor_makespan = makespan
-                melhor_individuo = individuo.copy()
-
-        historico.append(melhor_makespan)
-
-    cronograma_final = decodificar_individuo_simples(melhor_individuo, dados)
-    return cronograma_final, melhor_makespan, historico
+NOMES_FASES = {
+    "vizinhanca": "Geração de vizinhos",
+    "avaliacao": "Avaliação",
+    "decodificacao_final": "Decodificação final",
+    "populacao_inicial": "População inicial",
+    "selecao": "Seleção",
+    "cruzamento": "Cruzamento",
+    "mutacao": "Mutação",
+    "busca_local": "Busca local",
+    "elitismo": "Elitismo",
+}
+
+def mostrar_perfil(perfil, chave):
+    """Tempo por fase e contadores de uma execução (Perfil.como_dict()), com download em JSON"""
+    if perfil["tempos"]:
+        df_tempos = pd.DataFrame({
+            "Fase": [NOMES_FASES.get(f, f) for f in perfil["tempos"]],
+            "Tempo (s)": list(perfil["tempos"].values()),
+            "Fração": [f"{perfil['fracao_tempo'].get(f, 0):.1%}" for f in perfil["tempos"]],
+        })
+        st.bar_chart(df_tempos.set_index("Fase")["Tempo (s)"])
+        st.table(df_tempos.style.hide(axis="index"))
+    if perfil["contadores"]:
+        st.write("**Contadores:**")
+        st.table(pd.DataFrame({"Contador": list(perfil["contadores"]),
+                               "Valor": list(perfil["contadores"].values())}).style.hide(axis="index"))
+    st.download_button(
+        label="Baixar perfil (JSON)",
+        data=json.dumps(perfil, ensure_ascii=False, indent=2),
+        file_name=f"perfil_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json",
+        key=f"download_perfil_{chave}"
+    )
 
 # ==============================
 # TELAS DA APLICAÇÃO
@@ -485,18 +194,33 @@ def tela_metodos_basicos():
                 mostrar_solucao_inicial_aleatoria(st.session_state.dados_problema, st.session_state.solucao_inicial, st.session_state.df)
 
     with col2:
-        metodo = st.selectbox("Método", ["Subida de encosta", "Subida de encosta com tentativas", "Têmpera simulada"])
+        metodo = st.selectbox("Método", ["Subida de encosta", "Subida de encosta com tentativas", "Têmpera simulada", "Busca tabu"])
+        # A busca tabu só trabalha com as vizinhanças de caminho crítico
+        opcoes_vizinhanca = [nome for nome, valor in OPCOES_VIZINHANCA.items() if metodo != "Busca tabu" or valor != "aleatoria"]
+        vizinhanca = OPCOES_VIZINHANCA[st.selectbox("Vizinhança", opcoes_vizinhanca)]
 
         if metodo == "Subida de encosta com tentativas":
             tentativas = st.number_input("Número de Tentativas", min_value=1, value=3)
         elif metodo == "Têmpera simulada":
-            col_temp1, col_temp2, col_temp3 = st.columns(3)
+            calibrar = st.checkbox("Calibrar temperatura inicial", value=True)
+            col_temp1, col_temp2, col_temp3, col_temp4 = st.columns(4)
             with col_temp1:
-                temp_inicial = st.number_input("Temperatura Inicial", value=500)
+                temp_inicial = st.number_input("Temperatura Inicial", value=500, disabled=calibrar)
             with col_temp2:
                 temp_final = st.number_input("Temperatura Final", value=0.1)
             with col_temp3:
                 fator_resfriamento = st.number_input("Fator de Resfriamento", value=0.8)
+            with col_temp4:
+                # 0 = uma cadeia do tamanho do número de operações
+                movimentos = st.number_input("Movimentos por Temperatura", min_value=0, value=0)
+        elif metodo == "Busca tabu":
+            col_tabu1, col_tabu2, col_tabu3 = st.columns(3)
+            with col_tabu1:
+                max_iteracoes = st.number_input("Máximo de Iterações", min_value=1, value=500)
+            with col_tabu2:
+                tempo_limite = st.number_input("Tempo Limite (s)", min_value=0.1, value=5.0)
+            with col_tabu3:
+                tamanho_tabu = st.number_input("Tamanho da Lista Tabu", min_value=1, value=10)
 
         executar = st.button("Executar")
         
@@ -511,28 +235,45 @@ def tela_metodos_basicos():
             solucao_inicial = st.session_state.solucao_inicial
             makespan_inicial = st.session_state.makespan_inicial
 
+            # Busca tabu ainda não é instrumentada
+            perfil = Perfil() if metodo != "Busca tabu" else None
+
             if metodo == "Subida de encosta":
-                cronograma_otimizado, melhor_makespan = subida_de_encosta(dados, solucao_inicial)
+                cronograma_otimizado, melhor_makespan = subida_de_encosta(dados, solucao_inicial, vizinhanca=vizinhanca, perfil=perfil)
                 st.subheader("Solução (Subida de Encosta)")
                 st.dataframe(pd.DataFrame(cronograma_otimizado))
                 st.metric("Makespan Otimizado", f"{melhor_makespan} unidades de tempo")
 
             elif metodo == "Subida de encosta com tentativas":
-                cronograma_otimizado, melhor_makespan = subida_de_encosta_com_tentativas(dados, solucao_inicial, tmax=tentativas)
+                cronograma_otimizado, melhor_makespan = subida_de_encosta_com_tentativas(dados, solucao_inicial, tmax=tentativas, vizinhanca=vizinhanca, perfil=perfil)
                 st.subheader("Solução (Subida de Encosta com Tentativas)")
                 st.dataframe(pd.DataFrame(cronograma_otimizado))
                 st.metric("Makespan Otimizado", f"{melhor_makespan} unidades de tempo")
 
             elif metodo == "Têmpera simulada":
                 cronograma_otimizado, melhor_makespan = tempera_simulada(
-                    dados, solucao_inicial, temp_inicial=temp_inicial, temp_final=temp_final, fator=fator_resfriamento
+                    dados, solucao_inicial, temp_inicial=None if calibrar else temp_inicial, temp_final=temp_final,
+                    fator=fator_resfriamento, movimentos_por_temperatura=movimentos or None, vizinhanca=vizinhanca, perfil=perfil
                 )
                 st.subheader("Solução (Têmpera Simulada)")
                 st.dataframe(pd.DataFrame(cronograma_otimizado))
                 st.metric("Makespan Otimizado", f"{melhor_makespan} unidades de tempo")
+
+            elif metodo == "Busca tabu":
+                cronograma_otimizado, melhor_makespan = busca_tabu(
+                    dados, solucao_inicial, max_iteracoes=max_iteracoes, tempo_limite=tempo_limite,
+                    tamanho_tabu=tamanho_tabu, vizinhanca=vizinhanca
+                )
+                st.subheader("Solução (Busca Tabu)")
+                st.dataframe(pd.DataFrame(cronograma_otimizado))
+                st.metric("Makespan Otimizado", f"{melhor_makespan} unidades de tempo")
             
             ganho = (100 * (makespan_inicial - melhor_makespan) / makespan_inicial)
             st.metric("Ganho", f"{ganho:.2f} %")
+
+            if perfil is not None:
+                with st.expander("⏱️ Perfil"):
+                    mostrar_perfil(perfil.como_dict(), "basicos")
             
             # BOTÃO DE DOWNLOAD
             st.subheader("Download da Solução")
@@ -554,6 +295,59 @@ def tela_metodos_basicos():
             else:
                 st.warning("Por favor, clique em 'Solução Inicial' primeiro!")
 
+@st.fragment(run_every=1.0)
+def acompanhar_execucao_ag():
+    """Progresso do AG em segundo plano; ao terminar guarda os resultados e recarrega a página"""
+    info = st.session_state.get('ag_execucao')
+    execucao = obter_execucao(info['id']) if info else None
+    if execucao is None:
+        st.session_state.pop('ag_execucao', None)
+        return
+    
+    if execucao.ativa:
+        historico = execucao.historico
+        st.progress(min(len(historico) / info['ng'], 1.0),
+                    text=f"Executando Algoritmo Genético... geração {len(historico)} de {info['ng']}")
+        if execucao.melhor is not None:
+            st.metric("Melhor makespan até agora", f"{execucao.melhor}")
+        if historico:
+            st.line_chart(pd.DataFrame({
+                "Geração": range(1, len(historico) + 1),
+                "Makespan": historico
+            }).set_index("Geração"))
+        if st.button("Cancelar", key="cancelar_ag"):
+            execucao.cancelar()
+        return
+    
+    descartar_execucao(info['id'])
+    del st.session_state.ag_execucao
+    if execucao.erro is not None:
+        st.error(f"Erro no Algoritmo Genético: {execucao.erro}")
+        return
+    cronograma_otimizado, makespan_otimizado, historico, estatisticas = execucao.resultado
+    st.session_state.ag_resultados = {
+        'cronograma': cronograma_otimizado,
+        'makespan': makespan_otimizado,
+        'historico': historico,
+        'estatisticas': estatisticas
+    }
+    st.session_state.mostrar_resultados_ag = True
+    st.rerun()
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def executar_relatorio(chave_problema, _dados, solucao_inicial, tarefas):
+    """
+    Resultados do relatório, memorizados pelo hash do problema, pela solução
+    inicial e pelas tarefas (método e parâmetros); reruns não executam de novo
+    """
+    workers = min(len(tarefas), os.cpu_count() or 1)
+    return executar_comparativo(
+        _dados,
+        solucao_inicial,
+        [(sigla, metodo, dict(parametros)) for sigla, _, metodo, parametros in tarefas],
+        workers=workers,
+    )
+
 def gerar_relatorio_comparativo():
     st.header("RELATÓRIO COMPARATIVO - TODOS OS MÉTODOS")
     
@@ -576,29 +370,24 @@ def gerar_relatorio_comparativo():
     
     st.subheader("Resultados dos Métodos de Otimização")
     
-    # Executar todos os métodos
-    resultados = []
-    
-    # Subida de Encosta Simples
-    with st.spinner("Executando Subida de Encosta..."):
-        cronograma_se, makespan_se = subida_de_encosta(dados, solucao_inicial)
-        ganho_se = (100 * (makespan_inicial - makespan_se) / makespan_inicial)
-        resultados.append(["SE", "---", f"{ganho_se:.2f}%"])
-    
-    # Subida de Encosta com Tentativas
-    with st.spinner("Executando Subida com Tentativas..."):
-        cronograma_set1, makespan_set1 = subida_de_encosta_com_tentativas(dados, solucao_inicial, tmax=n)
-        ganho_set1 = (100 * (makespan_inicial - makespan_set1) / makespan_inicial)
-        resultados.append(["SET", f"TMAX={n}", f"{ganho_set1:.2f}%"])
+    # Executar todos os métodos (em paralelo, memorizados por problema, método e parâmetros)
+    tarefas = (
+        ("SE", "---", "subida", ()),
+        ("SET", f"TMAX={n}", "subida_tentativas", (("tmax", n),)),
+        ("TE", "TI=auto TF=0.1 FR=0.8", "tempera", (("temp_final", 0.1), ("fator", 0.8))),
+        ("TB", "IT=500 N5", "tabu", (("max_iteracoes", 500), ("tempo_limite", 5.0))),
+        ("AG", "TP=30 NG=50", "ag", (("tp", 30), ("ng", 50))),
+    )
+    with st.spinner("Executando os métodos..."):
+        execucoes = executar_relatorio(como_problema(dados).chave(), dados, solucao_inicial, tarefas)
     
-    # Têmpera Simulada
-    with st.spinner("Executando Têmpera Simulada..."):
-        cronograma_te1, makespan_te1 = tempera_simulada(dados, solucao_inicial, temp_inicial=500, temp_final=0.1, fator=0.8)
-        ganho_te1 = (100 * (makespan_inicial - makespan_te1) / makespan_inicial)
-        resultados.append(["TE", "TI=500 TF=0.1 FR=0.8", f"{ganho_te1:.2f}%"])
+    resultados = []
+    for (sigla, observacao, _, _), execucao in zip(tarefas, execucoes):
+        ganho = (100 * (makespan_inicial - execucao["makespan"]) / makespan_inicial)
+        resultados.append([sigla, observacao, f"{ganho:.2f}%", f"{execucao['tempo']:.2f}"])
     
     # Cria DataFrame com os resultados
-    df_resultados = pd.DataFrame(resultados, columns=["Método", "Observação", "Ganho"])
+    df_resultados = pd.DataFrame(resultados, columns=["Método", "Observação", "Ganho", "Tempo (s)"])
     
     # Exibir tabela
     st.subheader("Tabela de Resultados")
@@ -615,24 +404,24 @@ def gerar_relatorio_comparativo():
     
     # Cria relatório 
     relatorio_data = []
-    relatorio_data.append(["PROBLEMA", "", ""])
+    relatorio_data.append(["PROBLEMA", "", "", ""])
     for i, job in enumerate(dados):
-        relatorio_data.append([f"Job {i+1}", str(job), ""])
+        relatorio_data.append([f"Job {i+1}", str(job), "", ""])
     
-    relatorio_data.append(["", "", ""])
-    relatorio_data.append(["SOLUÇÃO INICIAL", f"Makespan: {makespan_inicial}", ""])
+    relatorio_data.append(["", "", "", ""])
+    relatorio_data.append(["SOLUÇÃO INICIAL", f"Makespan: {makespan_inicial}", "", ""])
     
-    relatorio_data.append(["", "", ""])
-    relatorio_data.append(["MÉTODO", "OBSERVAÇÃO", "GANHO"])
+    relatorio_data.append(["", "", "", ""])
+    relatorio_data.append(["MÉTODO", "OBSERVAÇÃO", "GANHO", "TEMPO (S)"])
     
     for linha in resultados:
         relatorio_data.append(linha)
     
-    relatorio_data.append(["", "", ""])
-    relatorio_data.append(["MELHOR MÉTODO", f"{melhor_metodo[0]} - {melhor_metodo[1]}", melhor_metodo[2]])
+    relatorio_data.append(["", "", "", ""])
+    relatorio_data.append(["MELHOR MÉTODO", f"{melhor_metodo[0]} - {melhor_metodo[1]}", melhor_metodo[2], melhor_metodo[3]])
     
     # Converte para CSV
-    df_relatorio = pd.DataFrame(relatorio_data, columns=["Método", "Observação", "Ganho"])
+    df_relatorio = pd.DataFrame(relatorio_data, columns=["Método", "Observação", "Ganho", "Tempo (s)"])
     csv_relatorio = df_relatorio.to_csv(index=False, sep=';', encoding='utf-8')
     
     # Botão de download
@@ -755,6 +544,27 @@ def tela_algoritmos_geneticos():
             ng = st.number_input("Número de Gerações (NG)", 
                                 min_value=10, max_value=200, value=30,
                                 key="ng_input")
+            workers = st.number_input("Processos (avaliação paralela / ilhas)",
+                                min_value=1, max_value=os.cpu_count() or 1, value=1,
+                                key="workers_input")
+            cache_mb = st.number_input("Cache de aptidão (MB, 0 desliga)",
+                                min_value=0, max_value=1024, value=16,
+                                key="cache_mb_input")
+            n_ilhas = st.number_input("Ilhas (1 = população única)",
+                                min_value=1, max_value=16, value=1,
+                                key="n_ilhas_input")
+            tempo_limite_ag = st.number_input("Tempo limite (s, 0 = sem limite)",
+                                min_value=0.0, max_value=3600.0, value=0.0, step=5.0,
+                                key="tempo_limite_ag_input")
+            if n_ilhas > 1:
+                intervalo_migracao = st.number_input("Migração a cada (gerações)",
+                                min_value=1, max_value=100, value=10,
+                                key="intervalo_migracao_input")
+                n_migrantes = st.number_input("Migrantes por ilha",
+                                min_value=1, max_value=20, value=2,
+                                key="n_migrantes_input")
+                topologia = st.selectbox("Topologia", ["anel", "completa"],
+                                key="topologia_select")
         with col_param2:
             tc = st.slider("Taxa de Cruzamento (TC)", 
                           min_value=0.0, max_value=1.0, value=0.8, step=0.05,
@@ -765,6 +575,19 @@ def tela_algoritmos_geneticos():
             ig = st.slider("Taxa de Elitismo (IG)", 
                           min_value=0.0, max_value=0.5, value=0.2, step=0.05,
                           key="ig_slider")
+            selecao = st.selectbox("Seleção",
+                          list(OPCOES_SELECAO.keys()),
+                          key="selecao_select")
+            cruzamento = st.selectbox("Cruzamento",
+                          list(OPCOES_CRUZAMENTO.keys()),
+                          key="cruzamento_select")
+            fracao_memetica = st.slider("Fração memética (busca local N5 nos melhores filhos)",
+                          min_value=0.0, max_value=0.5, value=0.0, step=0.05,
+                          key="fracao_memetica_slider")
+            max_avaliacoes_locais = st.number_input("Avaliações locais por filho",
+                          min_value=1, max_value=1000, value=50,
+                          key="max_avaliacoes_locais_input",
+                          disabled=fracao_memetica == 0)
         
         # Botão de execução
         executar_disabled = not st.session_state.ag_problema_carregado
@@ -780,33 +603,45 @@ def tela_algoritmos_geneticos():
                 st.error("Por favor, carregue um problema primeiro!")
                 st.stop()
             
-            # Container para mostrar progresso
-            progress_container = st.container()
-            
-            with progress_container:
-                with st.spinner("Executando Algoritmo Genético... Aguarde!"):
-                    # Executar AG
-                    cronograma_otimizado, makespan_otimizado, historico = algoritmo_genetico_simples(
-                        st.session_state.dados_ag,
-                        tp=tp,
-                        ng=ng,
-                        tc=tc,
-                        tm=tm,
-                        ig=ig
-                    )
-                
-                # Armazenar resultados no session_state
-                st.session_state.ag_resultados = {
-                    'cronograma': cronograma_otimizado,
-                    'makespan': makespan_otimizado,
-                    'historico': historico
-                }
-            
-            # Marcar que temos resultados para mostrar
-            st.session_state.mostrar_resultados_ag = True
-            
-            # Forçar rerun para mostrar resultados
-            st.rerun()
+            # Executar AG em segundo plano; a página acompanha pelo id da execução
+            parametros_ag = dict(
+                tp=tp,
+                ng=ng,
+                tc=tc,
+                tm=tm,
+                ig=ig,
+                workers=workers,
+                cache_mb=cache_mb,
+                selecao=OPCOES_SELECAO[selecao],
+                cruzamento=OPCOES_CRUZAMENTO[cruzamento],
+                fracao_memetica=fracao_memetica,
+                max_avaliacoes_locais=max_avaliacoes_locais,
+                tempo_limite=tempo_limite_ag or None
+            )
+            if n_ilhas > 1:
+                id_execucao = iniciar_execucao(
+                    algoritmo_genetico_ilhas,
+                    st.session_state.dados_ag,
+                    n_ilhas=n_ilhas,
+                    intervalo_migracao=intervalo_migracao,
+                    n_migrantes=n_migrantes,
+                    topologia=topologia,
+                    **parametros_ag
+                )
+            else:
+                id_execucao = iniciar_execucao(
+                    algoritmo_genetico_simples,
+                    st.session_state.dados_ag,
+                    perfil=Perfil(),
+                    **parametros_ag
+                )
+            if 'ag_execucao' in st.session_state:
+                descartar_execucao(st.session_state.ag_execucao['id'])
+            st.session_state.ag_execucao = {'id': id_execucao, 'ng': ng}
+            st.session_state.mostrar_resultados_ag = False
+        
+        if 'ag_execucao' in st.session_state:
+            acompanhar_execucao_ag()
         
         # Mostrar resultados se existirem
         if st.session_state.get('mostrar_resultados_ag', False) and 'ag_resultados' in st.session_state:
@@ -827,8 +662,11 @@ def tela_algoritmos_geneticos():
                          delta=f"{ganho:.1f}%" if ganho > 0 else None,
                          delta_color="normal" if ganho > 0 else "off")
             
+            if resultados.get('estatisticas', {}).get('interrompido'):
+                st.info(f"Execução cancelada: melhor solução até a geração {len(resultados['historico'])}.")
+            
             # Tabs para diferentes visualizações
-            tab1, tab2, tab3 = st.tabs(["📅 Cronograma", "📈 Convergência", "💾 Download"])
+            tab1, tab2, tab_perfil, tab3 = st.tabs(["📅 Cronograma", "📈 Convergência", "⏱️ Perfil", "💾 Download"])
             
             with tab1:
                 st.subheader("Cronograma Otimizado")
@@ -842,6 +680,9 @@ def tela_algoritmos_geneticos():
                         "Geração": range(1, len(resultados['historico']) + 1),
                         "Makespan": resultados['historico']
                     })
+                    # Com ilhas, uma linha por ilha além do melhor global
+                    for i, h in enumerate(resultados.get('estatisticas', {}).get('historicos_ilhas', [])):
+                        df_historico[f"Ilha {i+1}"] = h
                     st.line_chart(df_historico.set_index("Geração"))
                     
                     # Estatísticas
@@ -854,7 +695,30 @@ def tela_algoritmos_geneticos():
                     with col_stat3:
                         if len(resultados['historico']) >= 10:
                             st.metric("Média (últimas 10)", f"{np.mean(resultados['historico'][-10:]):.1f}")
+                    
+                    estatisticas = resultados.get('estatisticas', {})
+                    if 'avaliacoes' in estatisticas:
+                        st.metric("Avaliações", f"{estatisticas['avaliacoes']}")
+                    if 'avaliacoes_locais' in estatisticas:
+                        st.metric("Movimentos da busca local", f"{estatisticas['avaliacoes_locais']}")
+                    if 'cache_acertos' in estatisticas:
+                        st.write("**Cache de aptidão:**")
+                        col_cache1, col_cache2, col_cache3 = st.columns(3)
+                        with col_cache1:
+                            st.metric("Acertos", f"{estatisticas['cache_acertos']}")
+                        with col_cache2:
+                            st.metric("Falhas", f"{estatisticas['cache_falhas']}")
+                        with col_cache3:
+                            st.metric("Taxa de acerto", f"{estatisticas['cache_taxa_acerto']:.1%}")
             
+            with tab_perfil:
+                st.subheader("Onde o tempo foi gasto")
+                perfil_ag = resultados.get('estatisticas', {}).get('perfil')
+                if perfil_ag:
+                    mostrar_perfil(perfil_ag, "ag")
+                else:
+                    st.info("O perfil por fase é coletado apenas no AG sem ilhas.")
+
             with tab3:
                 st.subheader("Download da Solução")
                 csv_data = criar_arquivo_download(resultados['cronograma'])
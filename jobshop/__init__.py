@@ -0,0 +1,98 @@
+"""
+Job shop scheduling: problema, decodificadores, buscas locais e algoritmos genéticos.
+
+Os nomes públicos são carregados sob demanda (PEP 562): `import jobshop` não
+importa numpy nem os solvers até o primeiro uso, o que mantém rápida a partida
+da linha de comando (`python -m jobshop`) e dos workers.
+"""
+import importlib
+
+_EXPORTS = {
+    "Problema": "problema",
+    "como_problema": "problema",
+    "gerar_problema_aleatorio": "problema",
+    "como_gerador": "aleatorio",
+    "SorteioEmLote": "aleatorio",
+    "SequenciaMaquinas": "vizinhanca",
+    "Troca": "vizinhanca",
+    "Insercao": "vizinhanca",
+    "VIZINHANCAS": "vizinhanca",
+    "caminho_critico": "vizinhanca",
+    "vizinhanca_critica": "vizinhanca",
+    "AvaliadorIncremental": "grafo",
+    "INVIAVEL": "grafo",
+    "decodificar_sequencia": "grafo",
+    "reparar_sequencia": "grafo",
+    "avalia": "cronograma",
+    "gerar_solucao_inicial_aleatoria": "cronograma",
+    "cronograma_aleatorio": "cronograma",
+    "construir_lista_por_maquina": "cronograma",
+    "sequencia_do_cronograma": "cronograma",
+    "construir_cronograma": "cronograma",
+    "decodificar_individuo_simples": "cronograma",
+    "makespan_populacao": "cronograma",
+    "gerar_vizinho": "busca_local",
+    "subida_de_encosta": "busca_local",
+    "subida_de_encosta_com_tentativas": "busca_local",
+    "tempera_simulada": "busca_local",
+    "busca_tabu": "busca_local",
+    "descida_critica": "busca_local",
+    "pop_ini_jobshop": "genetico",
+    "aptidao_jobshop_simples": "genetico",
+    "aptidao_de_makespans": "genetico",
+    "selecao_roleta_simples": "genetico",
+    "selecao_roleta": "genetico",
+    "selecao_torneio": "genetico",
+    "selecao_ranking": "genetico",
+    "SELECOES": "genetico",
+    "cruzamento_ponto_unico": "genetico",
+    "mutacao_troca_simples": "genetico",
+    "cruzamento_ponto_unico_lote": "genetico",
+    "cruzamento_jox": "genetico",
+    "cruzamento_pox": "genetico",
+    "CRUZAMENTOS": "genetico",
+    "mutacao_troca_lote": "genetico",
+    "melhorar_cromossomos": "genetico",
+    "algoritmo_genetico_simples": "genetico",
+    "makespan_populacao_paralelo": "paralelo",
+    "encerrar_pool": "paralelo",
+    "CacheAptidao": "cache",
+    "TOPOLOGIAS": "ilhas",
+    "algoritmo_genetico_ilhas": "ilhas",
+    "METODOS_LOCAIS": "portfolio",
+    "portfolio_multi_inicio": "portfolio",
+    "METODOS_COMPARATIVO": "comparativo",
+    "executar_comparativo": "comparativo",
+    "Orcamento": "orcamento",
+    "Perfil": "perfil",
+    "ExecucaoSegundoPlano": "execucoes",
+    "iniciar_execucao": "execucoes",
+    "obter_execucao": "execucoes",
+    "descartar_execucao": "execucoes",
+    "Instancia": "benchmarks",
+    "MELHORES_CONHECIDOS": "benchmarks",
+    "ler_orlib": "benchmarks",
+    "ler_taillard": "benchmarks",
+    "ler_benchmark": "benchmarks",
+    "METODOS_SUITE": "desempenho",
+    "instancias_padrao": "desempenho",
+    "executar_suite": "desempenho",
+    "resumir": "desempenho",
+    "comparar_com_base": "desempenho",
+    "ler_instancia": "arquivos",
+    "salvar_cronograma": "arquivos",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(nome):
+    modulo = _EXPORTS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,71 @@
+"""
+Geradores aleatórios por execução. Os solvers e operadores recebem `semente`
+(inteiro, numpy.random.Generator ou None = entropia do sistema) em vez de usar o
+módulo global `random`, então execuções simultâneas não interferem entre si e a
+mesma semente repete o resultado.
+"""
+import numpy as np
+
+
+def como_gerador(semente=None):
+    """Aceita um Generator (usado como está), uma semente inteira ou None"""
+    if isinstance(semente, np.random.Generator):
+        return semente
+    if isinstance(semente, SorteioEmLote):
+        return semente.rng
+    return np.random.default_rng(semente)
+
+def como_sorteio(semente=None):
+    """SorteioEmLote sobre o gerador da semente (ou o próprio, se já for um)"""
+    if isinstance(semente, SorteioEmLote):
+        return semente
+    return SorteioEmLote(como_gerador(semente))
+
+
+class SorteioEmLote:
+    """
+    Sorteios escalares para os laços das buscas locais. Chamar o Generator a cada
+    decisão custa mais que o próprio movimento, então os uniformes vêm em blocos
+    de `tamanho` gerados de uma vez e são servidos um a um.
+    """
+
+    __slots__ = ("rng", "tamanho", "_valores", "_posicao", "_exponenciais", "_posicao_exp")
+
+    def __init__(self, rng, tamanho=1024):
+        self.rng = rng
+        self.tamanho = tamanho
+        self._valores = []
+        self._posicao = 0
+        self._exponenciais = []
+        self._posicao_exp = 0
+
+    def random(self):
+        """Uniforme em [0, 1)"""
+        if self._posicao == len(self._valores):
+            self._valores = self.rng.random(self.tamanho).tolist()
+            self._posicao = 0
+        valor = self._valores[self._posicao]
+        self._posicao += 1
+        return valor
+
+    def exponencial(self):
+        """Exponencial de média 1: P(T * exponencial() > d) = exp(-d / T), sem calcular exp"""
+        if self._posicao_exp == len(self._exponenciais):
+            self._exponenciais = self.rng.standard_exponential(self.tamanho).tolist()
+            self._posicao_exp = 0
+        valor = self._exponenciais[self._posicao_exp]
+        self._posicao_exp += 1
+        return valor
+
+    def randrange(self, n):
+        """Inteiro em [0, n)"""
+        return int(self.random() * n)
+
+    def choice(self, sequencia):
+        return sequencia[int(self.random() * len(sequencia))]
+
+    def par(self, n):
+        """Dois inteiros distintos em [0, n), n >= 2"""
+        i = int(self.random() * n)
+        j = int(self.random() * (n - 1))
+        return i, j + (j >= i)
@@ -0,0 +1,42 @@
+import csv
+import json
+import os
+from .benchmarks import detectar_formato, ler_benchmark
+from .problema import Problema
+
+COLUNAS_CRONOGRAMA = ["Job", "Operação", "Máquina", "Início", "Fim"]
+
+
+def ler_instancia(caminho, formato=None, nome=None):
+    """
+    Lê uma instância em JSON: lista de jobs [[máquina, duração], ...] ou
+    {"jobs": [...]}, no mesmo formato usado pela interface. Arquivos de outra
+    extensão (ou `formato` 'orlib'/'taillard') são lidos como benchmark; de um
+    arquivo com várias instâncias vem a primeira ou a de nome `nome`.
+    """
+    if formato is None and os.path.splitext(caminho)[1].lower() != ".json":
+        formato = detectar_formato(caminho)
+    if formato not in (None, "json"):
+        for instancia in ler_benchmark(caminho, formato):
+            if nome is None or instancia.nome == nome.lower():
+                return instancia.problema
+        raise ValueError(f"{caminho}: instância {nome!r} não encontrada")
+
+    with open(caminho, encoding="utf-8") as arquivo:
+        conteudo = json.load(arquivo)
+    if isinstance(conteudo, dict):
+        conteudo = conteudo.get("jobs")
+    if not isinstance(conteudo, list):
+        raise ValueError(f"{caminho}: esperado uma lista de jobs ou {{\"jobs\": [...]}}")
+    return Problema.de_dados([[(maquina, int(duracao)) for maquina, duracao in job] for job in conteudo])
+
+def salvar_cronograma(cronograma, caminho, makespan=None):
+    """Grava o cronograma em CSV (separador ';', como o download da interface) ou JSON, pela extensão"""
+    if os.path.splitext(caminho)[1].lower() == ".json":
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump({"makespan": makespan, "cronograma": cronograma}, arquivo, ensure_ascii=False, indent=2)
+        return
+    with open(caminho, "w", encoding="utf-8", newline="") as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS_CRONOGRAMA, delimiter=";")
+        escritor.writeheader()
+        escritor.writerows(cronograma)
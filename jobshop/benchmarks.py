@@ -0,0 +1,176 @@
+"""
+Leitura das instâncias clássicas de job shop nos formatos OR-Library e Taillard.
+
+Os arquivos são lidos linha a linha e cada instância vira um Problema assim que
+termina, então um arquivo com várias instâncias (jobshop1.txt, tai20_15.txt)
+é percorrido sem manter as demais na memória.
+"""
+import os
+import re
+from collections import namedtuple
+import numpy as np
+from .problema import Problema
+
+# melhor_conhecido vem só da tabela abaixo; limite_superior é o do cabeçalho de
+# Taillard, que nem sempre é o melhor conhecido (ta41–ta50 não têm ótimo provado)
+Instancia = namedtuple("Instancia", ["nome", "problema", "melhor_conhecido", "limite_superior"],
+                       defaults=(None,))
+
+# Makespans ótimos (ou melhores conhecidos) da literatura
+MELHORES_CONHECIDOS = {
+    "ft06": 55, "ft10": 930, "ft20": 1165,
+    "la01": 666, "la02": 655, "la03": 597, "la04": 590, "la05": 593,
+    "la06": 926, "la07": 890, "la08": 863, "la09": 951, "la10": 958,
+    "la11": 1222, "la12": 1039, "la13": 1150, "la14": 1292, "la15": 1207,
+    "la16": 945, "la17": 784, "la18": 848, "la19": 842, "la20": 902,
+    "la21": 1046, "la22": 927, "la23": 1032, "la24": 935, "la25": 977,
+    "la26": 1218, "la27": 1235, "la28": 1216, "la29": 1152, "la30": 1355,
+    "la31": 1784, "la32": 1850, "la33": 1719, "la34": 1721, "la35": 1888,
+    "la36": 1268, "la37": 1397, "la38": 1196, "la39": 1233, "la40": 1222,
+    "ta01": 1231, "ta02": 1244, "ta03": 1218, "ta04": 1175, "ta05": 1224,
+    "ta06": 1238, "ta07": 1227, "ta08": 1217, "ta09": 1274, "ta10": 1241,
+    "ta11": 1357, "ta12": 1367, "ta13": 1342, "ta14": 1345, "ta15": 1339,
+    "ta16": 1360, "ta17": 1462, "ta18": 1396, "ta19": 1332, "ta20": 1348,
+    "ta21": 1642, "ta22": 1600, "ta23": 1557, "ta24": 1644, "ta25": 1595,
+    "ta26": 1643, "ta27": 1680, "ta28": 1603, "ta29": 1625, "ta30": 1584,
+    "ta31": 1764, "ta32": 1784, "ta33": 1791, "ta34": 1828, "ta35": 2007,
+    "ta36": 1819, "ta37": 1771, "ta38": 1673, "ta39": 1795, "ta40": 1669,
+    "ta51": 2760, "ta52": 2756, "ta53": 2717, "ta54": 2839, "ta55": 2679,
+    "ta56": 2781, "ta57": 2943, "ta58": 2885, "ta59": 2655, "ta60": 2723,
+    "ta61": 2868, "ta62": 2869, "ta63": 2755, "ta64": 2702, "ta65": 2725,
+    "ta66": 2845, "ta67": 2825, "ta68": 2784, "ta69": 3071, "ta70": 2995,
+    "ta71": 5464, "ta72": 5181, "ta73": 5568, "ta74": 5339, "ta75": 5392,
+    "ta76": 5342, "ta77": 5436, "ta78": 5394, "ta79": 5358, "ta80": 5183,
+}
+
+# Arquivos em lote de Taillard (taiJ_M.txt): primeiro índice de cada tamanho
+_PRIMEIRA_TAILLARD = {
+    (15, 15): 1, (20, 15): 11, (20, 20): 21, (30, 15): 31,
+    (30, 20): 41, (50, 15): 51, (50, 20): 61, (100, 20): 71,
+}
+_NUMEROS = re.compile(r"^[\s\d-]+$")
+
+
+def _inteiros(linha):
+    return np.array(linha.split(), dtype=np.int64)
+
+def _linhas(fonte):
+    # Aceita caminho ou arquivo já aberto; só percorre, sem ler tudo de uma vez
+    if hasattr(fonte, "read"):
+        yield from fonte
+        return
+    with open(fonte, encoding="utf-8", errors="replace") as arquivo:
+        yield from arquivo
+
+def _coletar(linhas, quantidade):
+    """Lê inteiros das próximas linhas numéricas até juntar `quantidade`"""
+    partes, total = [], 0
+    for linha in linhas:
+        linha = linha.strip()
+        if not linha:
+            continue
+        if not _NUMEROS.match(linha):
+            raise ValueError(f"Esperados {quantidade} números, encontrado: {linha[:40]!r}")
+        numeros = _inteiros(linha)
+        partes.append(numeros)
+        total += len(numeros)
+        if total >= quantidade:
+            break
+    if total < quantidade:
+        raise ValueError(f"Fim do arquivo: esperados {quantidade} números, lidos {total}")
+    return np.concatenate(partes)[:quantidade]
+
+def _nome_base(fonte):
+    caminho = getattr(fonte, "name", fonte)
+    return os.path.splitext(os.path.basename(str(caminho)))[0].lower()
+
+def _instancia(nome, rotas, duracoes, limite_superior=None):
+    return Instancia(nome, Problema(rotas, duracoes), MELHORES_CONHECIDOS.get(nome), limite_superior)
+
+
+def ler_orlib(fonte):
+    """
+    Instâncias no formato OR-Library: linha "n m" seguida de n linhas com m pares
+    (máquina a partir de 0, duração). Aceita um arquivo com uma instância ou o
+    jobshop1.txt, com várias separadas por "instance <nome>" e uma descrição.
+    Gera Instancia(nome, problema, melhor_conhecido) uma de cada vez.
+    """
+    linhas = iter(_linhas(fonte))
+    base = _nome_base(fonte)
+    nome, contador = None, 0
+    for linha in linhas:
+        texto = linha.strip()
+        if not texto or texto.startswith("+"):
+            continue
+        if texto.lower().startswith("instance"):
+            nome = texto.split()[-1].lower()
+            continue
+        if not _NUMEROS.match(texto):
+            continue  # descrição da instância
+        cabecalho = _inteiros(texto)
+        if len(cabecalho) != 2:
+            raise ValueError(f"Cabeçalho 'jobs máquinas' esperado, encontrado: {texto[:40]!r}")
+        n_jobs, n_maquinas = (int(v) for v in cabecalho)
+        pares = _coletar(linhas, 2 * n_jobs * n_maquinas).reshape(n_jobs, n_maquinas, 2)
+        contador += 1
+        if nome is None:
+            nome = base if contador == 1 else f"{base}_{contador}"
+        yield _instancia(nome, pares[:, :, 0], pares[:, :, 1])
+        nome = None
+
+def ler_taillard(fonte):
+    """
+    Instâncias no formato de Taillard: cabeçalho "Nb of jobs, Nb of Machines, ...",
+    linha com jobs, máquinas, sementes e limites, seções "Times" e "Machines"
+    (máquinas a partir de 1). Um arquivo pode trazer várias; nos lotes padrão
+    (tai15_15.txt, ...) elas recebem os nomes ta01..ta80. O limite superior do
+    cabeçalho vai em limite_superior, não em melhor_conhecido.
+    """
+    linhas = iter(_linhas(fonte))
+    base = _nome_base(fonte)
+    padrao = re.fullmatch(r"tai?(\d+)_(\d+)", base)
+    contador = 0
+    for linha in linhas:
+        texto = linha.strip()
+        if not texto or not _NUMEROS.match(texto):
+            continue
+        cabecalho = _inteiros(texto)
+        if len(cabecalho) < 2:
+            continue
+        n_jobs, n_maquinas = int(cabecalho[0]), int(cabecalho[1])
+        limite_superior = int(cabecalho[4]) if len(cabecalho) >= 5 else None
+
+        secoes = {}
+        for secao in ("times", "machines"):
+            linha = next((linha for linha in linhas if linha.strip()), "")
+            if not linha:
+                raise ValueError(f"Fim do arquivo: seção '{secao.capitalize()}' esperada")
+            if linha.strip().lower() != secao:
+                raise ValueError(f"Seção '{secao.capitalize()}' esperada, encontrado: {linha.strip()[:40]!r}")
+            secoes[secao] = _coletar(linhas, n_jobs * n_maquinas).reshape(n_jobs, n_maquinas)
+
+        contador += 1
+        if padrao and (n_jobs, n_maquinas) in _PRIMEIRA_TAILLARD:
+            nome = f"ta{_PRIMEIRA_TAILLARD[n_jobs, n_maquinas] + contador - 1:02d}"
+        else:
+            nome = base if contador == 1 else f"{base}_{contador}"
+        yield _instancia(nome, secoes["machines"] - 1, secoes["times"], limite_superior)
+
+def detectar_formato(fonte):
+    """'taillard' se o arquivo tiver a seção Times, senão 'orlib' (só olha o começo)"""
+    for i, linha in enumerate(_linhas(fonte)):
+        texto = linha.strip().lower()
+        if texto == "times" or texto.startswith("nb of jobs"):
+            return "taillard"
+        if i > 50:
+            break
+    return "orlib"
+
+def ler_benchmark(caminho, formato=None):
+    """Gera as instâncias de um arquivo OR-Library ou Taillard (formato detectado se None)"""
+    formato = formato or detectar_formato(caminho)
+    if formato == "taillard":
+        return ler_taillard(caminho)
+    if formato == "orlib":
+        return ler_orlib(caminho)
+    raise ValueError(f"Formato desconhecido: {formato}")
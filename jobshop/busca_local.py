@@ -0,0 +1,432 @@
+import math
+import time
+from .problema import como_problema
+from .cronograma import avalia, sequencia_do_cronograma
+from .grafo import AvaliadorIncremental, INVIAVEL, decodificar_sequencia, reparar_sequencia
+from .vizinhanca import Troca, VIZINHANCAS, vizinhanca_critica
+from .orcamento import Orcamento
+from .aleatorio import como_sorteio
+
+
+class _AvaliadorCompleto:
+    """Mesma interface do AvaliadorIncremental, decodificando a sequência inteira a cada troca"""
+
+    def __init__(self, problema, sequencia):
+        self.problema = problema
+        self.sequencia = sequencia
+        self.makespan = decodificar_sequencia(problema, sequencia, makespan_only=True, reparar=False)
+        self._movimento = None
+        self._makespan_anterior = self.makespan
+
+    def estimativa(self, movimento):
+        return 0
+
+    def aplicar(self, movimento):
+        movimento.aplicar(self.sequencia)
+        self._movimento = movimento
+        self._makespan_anterior = self.makespan
+        self.makespan = decodificar_sequencia(self.problema, self.sequencia, makespan_only=True, reparar=False)
+        return self.makespan
+
+    def desfazer(self):
+        if self._movimento is not None:
+            self._movimento.desfazer(self.sequencia)
+            self.makespan = self._makespan_anterior
+            self._movimento = None
+
+    def cronograma(self):
+        return decodificar_sequencia(self.problema, self.sequencia)
+
+
+def _criar_avaliador(problema, sequencia, incremental):
+    """
+    Os dois avaliadores usam o grafo disjuntivo; o incremental atualiza só as
+    cabeças/caudas afetadas por cada troca
+    """
+    if incremental:
+        return AvaliadorIncremental(problema, sequencia)
+    return _AvaliadorCompleto(problema, sequencia)
+
+def gerar_vizinho(sequencia, semente=None):
+    """Sorteia uma troca de duas operações numa máquina; quem chama aplica e desfaz"""
+    sorteio = como_sorteio(semente)
+    maquina = sorteio.randrange(len(sequencia))
+    n = sequencia.tamanho(maquina)
+    if n >= 2:
+        i, j = sorteio.par(n)
+        return Troca(maquina, i, j)
+    return Troca(maquina, 0, 0)
+
+def _preparar_busca(dados, solucao_inicial, incremental, vizinhanca):
+    if vizinhanca not in VIZINHANCAS:
+        raise ValueError(f"Vizinhança desconhecida: {vizinhanca}")
+    problema = como_problema(dados)
+    # As vizinhanças de caminho crítico precisam das cabeças do avaliador incremental
+    incremental = incremental or vizinhanca != "aleatoria"
+    avaliador = _criar_avaliador(problema, _sequencia_inicial(problema, solucao_inicial), incremental)
+    return problema, avaliador
+
+def _sortear_movimento(avaliador, vizinhanca, sorteio):
+    """Um vizinho da solução atual; None se a vizinhança crítica estiver vazia"""
+    if vizinhanca == "aleatoria":
+        return gerar_vizinho(avaliador.sequencia, sorteio)
+    movimentos = vizinhanca_critica(avaliador, vizinhanca)
+    return sorteio.choice(movimentos) if movimentos else None
+
+def _sequencia_inicial(problema, solucao_inicial):
+    """Sequências de máquina da solução inicial, já sem ciclos"""
+    sequencia = sequencia_do_cronograma(problema, solucao_inicial)
+    reparar_sequencia(problema, sequencia)
+    return sequencia
+
+def _cronograma_final(problema, solucao_inicial, melhor_ops):
+    """Monta o cronograma detalhado apenas da melhor solução encontrada"""
+    if melhor_ops is None:
+        return solucao_inicial
+    return decodificar_sequencia(problema, melhor_ops)
+
+def _concluir(problema, solucao_inicial, melhor_ops, perfil, avaliador, vizinhos, aceitos, rejeitados, historico,
+              calibracao=0):
+    """
+    Cronograma final da busca; com perfil, registra os contadores acumulados no laço.
+    calibracao: vizinhos avaliados (e desfeitos) antes do laço, já somados em `vizinhos`.
+    """
+    if perfil is None:
+        return _cronograma_final(problema, solucao_inicial, melhor_ops)
+    inicio = time.perf_counter()
+    cronograma = _cronograma_final(problema, solucao_inicial, melhor_ops)
+    perfil.medir("decodificacao_final", inicio)
+    avaliados = aceitos + rejeitados + calibracao
+    completo = isinstance(avaliador, _AvaliadorCompleto)
+    perfil.contar("vizinhos", vizinhos)
+    perfil.contar("descartados_estimativa", vizinhos - avaliados)
+    perfil.contar("aceitos", aceitos)
+    perfil.contar("rejeitados", rejeitados)
+    if calibracao:
+        perfil.contar("amostras_calibracao", calibracao)
+    perfil.contar("melhoras", len(historico) - 1)
+    perfil.contar("avaliacoes_incrementais", 0 if completo else avaliados)
+    # Decodificações completas: a inicial, a final e, sem avaliador incremental, uma por vizinho
+    perfil.contar("decodificacoes", 1 + (melhor_ops is not None) + (avaliados if completo else 0))
+    return cronograma
+
+def _registrar_melhora(historico, makespan, progresso):
+    # Anota a nova melhor e avisa progresso; True = a busca deve parar
+    historico.append(makespan)
+    return progresso is not None and bool(progresso(historico))
+
+def subida_de_encosta(dados, solucao_inicial, incremental=True, vizinhanca="aleatoria",
+                      tempo_limite=None, max_avaliacoes=None, progresso=None, orcamento=None, semente=None,
+                      perfil=None):
+    """
+    Aplica vizinhos sorteados enquanto melhoram e para no primeiro que não
+    melhora. Retorna (cronograma, makespan).
+    tempo_limite (s) / max_avaliacoes limitam a busca; um Orcamento já criado pode
+    vir em `orcamento`, no lugar deles, para ler depois as avaliações feitas.
+    progresso(historico) é chamado a cada nova melhor solução; retornar True
+    interrompe a busca, que devolve a melhor até ali.
+    semente: inteiro, numpy.random.Generator ou None (ver aleatorio.como_gerador).
+    perfil: um perfil.Perfil para contar vizinhos/aceites e cronometrar as fases.
+    """
+    problema, avaliador = _preparar_busca(dados, solucao_inicial, incremental, vizinhanca)
+    orcamento = orcamento or Orcamento(tempo_limite, max_avaliacoes)
+    sorteio = como_sorteio(semente)
+    medir = perfil is not None
+    melhor_ops = None
+    melhor_makespan = avalia(solucao_inicial)
+    historico = [melhor_makespan]
+    vizinhos = aceitos = rejeitados = 0
+
+    while not orcamento.esgotado():
+        if medir:
+            relogio = time.perf_counter()
+        movimento = _sortear_movimento(avaliador, vizinhanca, sorteio)
+        vizinhos += 1
+        if medir:
+            relogio = perfil.medir("vizinhanca", relogio)
+        if movimento is None or avaliador.estimativa(movimento) >= melhor_makespan:
+            break
+        makespan_vizinho = avaliador.aplicar(movimento)
+        orcamento.contar()
+        if medir:
+            perfil.medir("avaliacao", relogio)
+
+        if makespan_vizinho < melhor_makespan:
+            aceitos += 1
+            melhor_ops = avaliador.sequencia
+            melhor_makespan = makespan_vizinho
+            if _registrar_melhora(historico, melhor_makespan, progresso):
+                break
+        else:
+            rejeitados += 1
+            avaliador.desfazer()
+            break
+
+    cronograma = _concluir(problema, solucao_inicial, melhor_ops, perfil, avaliador, vizinhos, aceitos, rejeitados, historico)
+    return cronograma, melhor_makespan
+
+def subida_de_encosta_com_tentativas(dados, solucao_inicial, tmax=3, incremental=True, vizinhanca="aleatoria",
+                                     tempo_limite=None, max_avaliacoes=None, progresso=None, orcamento=None, semente=None,
+                                     perfil=None):
+    """
+    Como subida_de_encosta, mas só para após tmax vizinhos seguidos sem melhora.
+    Orçamento, progresso, semente e perfil também são os de subida_de_encosta.
+    """
+    problema, avaliador = _preparar_busca(dados, solucao_inicial, incremental, vizinhanca)
+    orcamento = orcamento or Orcamento(tempo_limite, max_avaliacoes)
+    sorteio = como_sorteio(semente)
+    medir = perfil is not None
+    melhor_ops = None
+    melhor_makespan = avalia(solucao_inicial)
+    historico = [melhor_makespan]
+    vizinhos = aceitos = rejeitados = 0
+
+    t = 0
+    while t < tmax and not orcamento.esgotado():
+        if medir:
+            relogio = time.perf_counter()
+        movimento = _sortear_movimento(avaliador, vizinhanca, sorteio)
+        vizinhos += 1
+        if medir:
+            relogio = perfil.medir("vizinhanca", relogio)
+        if movimento is None or avaliador.estimativa(movimento) >= melhor_makespan:
+            t += 1
+            continue
+        makespan_vizinho = avaliador.aplicar(movimento)
+        orcamento.contar()
+        if medir:
+            perfil.medir("avaliacao", relogio)
+
+        if makespan_vizinho < melhor_makespan:
+            aceitos += 1
+            melhor_ops = avaliador.sequencia
+            melhor_makespan = makespan_vizinho
+            t = 0
+            if _registrar_melhora(historico, melhor_makespan, progresso):
+                break
+        else:
+            rejeitados += 1
+            avaliador.desfazer()
+            t += 1
+
+    cronograma = _concluir(problema, solucao_inicial, melhor_ops, perfil, avaliador, vizinhos, aceitos, rejeitados, historico)
+    return cronograma, melhor_makespan
+
+def _calibrar_temperatura(problema, avaliador, vizinhanca, sorteio, orcamento, aceitacao, amostras=50):
+    """
+    Temperatura em que uma variação típica de makespan entre vizinhos sorteados da
+    solução atual (aplicados e desfeitos) seria aceita com probabilidade `aceitacao`:
+    T0 = -média(|Δ| ≠ 0) / ln(aceitacao). Usa o módulo de Δ porque, a partir de uma
+    solução inicial ruim, quase todos os vizinhos melhoram; sem nenhuma variação,
+    a escala é a duração média das operações. Retorna (T0, vizinhos avaliados).
+    """
+    variacoes = []
+    avaliados = 0
+    for _ in range(amostras):
+        if orcamento.esgotado():
+            break
+        movimento = _sortear_movimento(avaliador, vizinhanca, sorteio)
+        if movimento is None:
+            break
+        atual = avaliador.makespan
+        makespan = avaliador.aplicar(movimento)
+        avaliador.desfazer()
+        orcamento.contar()
+        avaliados += 1
+        if makespan != atual and makespan < INVIAVEL:
+            variacoes.append(abs(makespan - atual))
+    escala = sum(variacoes) / len(variacoes) if variacoes else float(problema.duracao_op.mean())
+    return -escala / math.log(aceitacao), avaliados
+
+def tempera_simulada(dados, solucao_inicial, temp_inicial=None, temp_final=0.1, fator=0.8, incremental=True, vizinhanca="aleatoria",
+                     tempo_limite=None, max_avaliacoes=None, progresso=None, orcamento=None, semente=None,
+                     perfil=None, movimentos_por_temperatura=None, aceitacao_inicial=0.8, estagnacao=10,
+                     max_reaquecimentos=10):
+    """
+    Têmpera simulada com cadeias de `movimentos_por_temperatura` vizinhos por nível
+    (padrão: número de operações) e resfriamento geométrico por `fator`.
+    temp_inicial=None calibra a temperatura inicial para aceitar a variação média
+    de makespan dos vizinhos com probabilidade aceitacao_inicial. Após `estagnacao` níveis sem
+    melhorar a melhor solução, ou ao chegar a temp_final, reaquece até a temperatura
+    em que a melhor foi encontrada (no máximo max_reaquecimentos vezes).
+    Uma piora Δ é aceita se Δ < T·E, com E exponencial sorteada em lote: a mesma
+    probabilidade exp(-Δ/T), sem calcular exp a cada vizinho.
+    Orçamento, progresso, semente e perfil como em subida_de_encosta.
+    """
+    if not 0 < fator < 1:
+        raise ValueError("fator deve estar entre 0 e 1")
+    if not 0 < aceitacao_inicial < 1:
+        raise ValueError("aceitacao_inicial deve estar entre 0 e 1")
+    problema, avaliador = _preparar_busca(dados, solucao_inicial, incremental, vizinhanca)
+    orcamento = orcamento or Orcamento(tempo_limite, max_avaliacoes)
+    sorteio = como_sorteio(semente)
+    medir = perfil is not None
+    melhor_ops = None
+    melhor_makespan = avalia(solucao_inicial)
+    historico = [melhor_makespan]
+    vizinhos = aceitos = rejeitados = calibracao = 0
+    if movimentos_por_temperatura is None:
+        movimentos_por_temperatura = max(1, problema.total_ops)
+    if temp_inicial is None:
+        if medir:
+            relogio = time.perf_counter()
+        temp_inicial, calibracao = _calibrar_temperatura(problema, avaliador, vizinhanca, sorteio, orcamento,
+                                                         aceitacao_inicial)
+        vizinhos += calibracao
+        if medir:
+            perfil.medir("calibracao", relogio)
+
+    atual_makespan = avaliador.makespan
+    temperatura = temp_melhor = temp_inicial
+    niveis = niveis_sem_melhora = reaquecimentos = 0
+    parar = False
+
+    while not parar:
+        melhorou = False
+        for _ in range(movimentos_por_temperatura):
+            if orcamento.esgotado():
+                parar = True
+                break
+            if medir:
+                relogio = time.perf_counter()
+            movimento = _sortear_movimento(avaliador, vizinhanca, sorteio)
+            vizinhos += 1
+            if medir:
+                relogio = perfil.medir("vizinhanca", relogio)
+            if movimento is None:
+                parar = True  # vizinhança crítica vazia: a solução atual é ótima
+                break
+            makespan_vizinho = avaliador.aplicar(movimento)
+            orcamento.contar()
+            if medir:
+                perfil.medir("avaliacao", relogio)
+
+            delta = makespan_vizinho - atual_makespan
+            if delta <= 0 or delta < temperatura * sorteio.exponencial():
+                aceitos += 1
+                atual_makespan = makespan_vizinho
+                if makespan_vizinho < melhor_makespan:
+                    melhor_ops = avaliador.sequencia.copy()
+                    melhor_makespan = makespan_vizinho
+                    temp_melhor = temperatura
+                    melhorou = True
+                    if _registrar_melhora(historico, melhor_makespan, progresso):
+                        parar = True
+                        break
+            else:
+                rejeitados += 1
+                avaliador.desfazer()
+
+        niveis += 1
+        niveis_sem_melhora = 0 if melhorou else niveis_sem_melhora + 1
+        temperatura *= fator
+        esfriou = temperatura <= temp_final
+        if esfriou or (estagnacao and niveis_sem_melhora >= estagnacao):
+            if reaquecimentos < max_reaquecimentos:
+                reaquecimentos += 1
+                temperatura = max(temp_melhor, temp_final / fator)
+                niveis_sem_melhora = 0
+            elif esfriou:
+                break
+
+    if perfil is not None:
+        perfil.contar("niveis_temperatura", niveis)
+        perfil.contar("reaquecimentos", reaquecimentos)
+    cronograma = _concluir(problema, solucao_inicial, melhor_ops, perfil, avaliador, vizinhos, aceitos, rejeitados, historico,
+                           calibracao)
+    return cronograma, melhor_makespan
+
+def busca_tabu(dados, solucao_inicial, max_iteracoes=500, tempo_limite=None, tamanho_tabu=None, vizinhanca="n5",
+               max_avaliacoes=None, progresso=None, orcamento=None, semente=None):
+    """
+    Busca tabu sobre a vizinhança de caminho crítico. O atributo proibido é o
+    par de operações cuja ordem relativa o movimento inverteu, guardado num
+    dicionário (chave inteira -> iteração em que expira), com critério de
+    aspiração por melhora do melhor makespan. Para em max_iteracoes,
+    tempo_limite (segundos) ou max_avaliacoes; orcamento, progresso e semente
+    como em subida_de_encosta.
+    """
+    if vizinhanca == "aleatoria":
+        raise ValueError("A busca tabu usa uma vizinhança de caminho crítico (n5 ou n7)")
+    problema, avaliador = _preparar_busca(dados, solucao_inicial, True, vizinhanca)
+    n = problema.total_ops
+    if tamanho_tabu is None:
+        tamanho_tabu = max(8, (problema.n_jobs + problema.n_maquinas) // 2)
+    orcamento = orcamento or Orcamento(tempo_limite, max_avaliacoes)
+    sorteio = como_sorteio(semente)
+
+    melhor_ops = None
+    melhor_makespan = avalia(solucao_inicial)
+    historico = [melhor_makespan]
+    tabu = {}
+
+    for iteracao in range(max_iteracoes):
+        if orcamento.esgotado():
+            break
+        movimentos = vizinhanca_critica(avaliador, vizinhanca)
+        if not movimentos:
+            break  # sem blocos críticos: a solução atual é ótima
+
+        # Avalia em ordem do limite inferior e para quando nenhum restante pode ganhar
+        candidatos = sorted(((avaliador.estimativa(m), k, m) for k, m in enumerate(movimentos)), key=lambda c: c[:2])
+        escolhido, makespan_escolhido, chave_escolhida = None, math.inf, None
+        for estimativa, _, movimento in candidatos:
+            if estimativa >= makespan_escolhido:
+                break
+            primeiro, ultimo = movimento.extremos(avaliador.sequencia)
+            chave = ultimo * n + primeiro  # o par (ultimo, primeiro) passa a ter a ordem invertida
+            proibido = tabu.get(primeiro * n + ultimo, -1) > iteracao
+            if proibido and estimativa >= melhor_makespan:
+                continue
+            makespan_vizinho = avaliador.aplicar(movimento)
+            avaliador.desfazer()
+            orcamento.contar()
+            if proibido and makespan_vizinho >= melhor_makespan:
+                continue
+            if makespan_vizinho < makespan_escolhido:
+                escolhido, makespan_escolhido, chave_escolhida = movimento, makespan_vizinho, chave
+        if escolhido is None:
+            # Todos proibidos: segue com um movimento qualquer para não estagnar
+            escolhido = sorteio.choice(movimentos)
+            primeiro, ultimo = escolhido.extremos(avaliador.sequencia)
+            chave_escolhida = ultimo * n + primeiro
+
+        if avaliador.aplicar(escolhido) is INVIAVEL:
+            continue
+        tabu[chave_escolhida] = iteracao + tamanho_tabu
+        if avaliador.makespan < melhor_makespan:
+            melhor_ops = avaliador.sequencia.copy()
+            melhor_makespan = avaliador.makespan
+            if _registrar_melhora(historico, melhor_makespan, progresso):
+                break
+
+        # Descarta atributos vencidos para o dicionário não crescer sem limite
+        if len(tabu) > 4 * tamanho_tabu:
+            tabu = {c: fim for c, fim in tabu.items() if fim > iteracao}
+
+    return _cronograma_final(problema, solucao_inicial, melhor_ops), melhor_makespan
+
+def descida_critica(avaliador, max_avaliacoes=50, vizinhanca="n5"):
+    """
+    Descida por primeira melhora na vizinhança de caminho crítico, limitada a
+    max_avaliacoes movimentos avaliados. Altera o avaliador no lugar e retorna
+    quantos movimentos avaliou.
+    """
+    if vizinhanca == "aleatoria":
+        raise ValueError("A descida usa uma vizinhança de caminho crítico (n5 ou n7)")
+    avaliacoes = 0
+    melhorou = True
+    while melhorou and avaliacoes < max_avaliacoes:
+        melhorou = False
+        for movimento in vizinhanca_critica(avaliador, vizinhanca):
+            if avaliacoes >= max_avaliacoes:
+                break
+            if avaliador.estimativa(movimento) >= avaliador.makespan:
+                continue
+            avaliacoes += 1
+            anterior = avaliador.makespan
+            if avaliador.aplicar(movimento) < anterior:
+                melhorou = True
+                break
+            avaliador.desfazer()
+    return avaliacoes
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+import numpy as np
+from .paralelo import makespan_populacao_paralelo
+
+# Custo aproximado de uma entrada além dos bytes da chave
+# (objeto bytes, int do makespan e nó do OrderedDict)
+_CUSTO_ENTRADA = 120
+
+
+class CacheAptidao:
+    """
+    Cache LRU de makespans por cromossomo (representação por operações).
+    A chave é o cromossomo em bytes (int8, ou int16 com mais de 127 jobs);
+    quando os bytes ocupados passam de `limite_mb`, sai o menos usado.
+    """
+
+    def __init__(self, limite_mb=16):
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+        self._entradas = OrderedDict()
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def chaves(self, pop, problema):
+        tipo = np.int8 if problema.n_jobs <= 127 else np.int16
+        matriz = np.ascontiguousarray(np.asarray(pop, dtype=tipo))
+        return [linha.tobytes() for linha in matriz]
+
+    def avaliar(self, pop, problema, workers=None):
+        """Makespans da população; só os cromossomos fora do cache são decodificados"""
+        makespans = np.empty(len(pop), dtype=np.int64)
+        pendentes = {}
+        for i, chave in enumerate(self.chaves(pop, problema)):
+            valor = self._entradas.get(chave)
+            if valor is not None:
+                self._entradas.move_to_end(chave)
+                makespans[i] = valor
+                self.acertos += 1
+            else:
+                # Duplicatas dentro do mesmo lote são decodificadas uma vez só
+                pendentes.setdefault(chave, []).append(i)
+                self.falhas += 1
+
+        if pendentes:
+            indices = [posicoes[0] for posicoes in pendentes.values()]
+            novos = makespan_populacao_paralelo([pop[i] for i in indices], problema, workers)
+            for (chave, posicoes), valor in zip(pendentes.items(), novos.tolist()):
+                makespans[posicoes] = valor
+                self._guardar(chave, valor)
+        return makespans
+
+    def _guardar(self, chave, valor):
+        if len(chave) + _CUSTO_ENTRADA > self.limite_bytes:
+            return
+        self._entradas[chave] = valor
+        self.bytes_usados += len(chave) + _CUSTO_ENTRADA
+        while self.bytes_usados > self.limite_bytes:
+            antiga, _ = self._entradas.popitem(last=False)
+            self.bytes_usados -= len(antiga) + _CUSTO_ENTRADA
+            self.remocoes += 1
+
+    def estatisticas(self):
+        consultas = self.acertos + self.falhas
+        return {
+            "cache_acertos": self.acertos,
+            "cache_falhas": self.falhas,
+            "cache_taxa_acerto": self.acertos / consultas if consultas else 0.0,
+            "cache_entradas": len(self._entradas),
+            "cache_remocoes": self.remocoes,
+        }
@@ -0,0 +1,165 @@
+"""
+Linha de comando sem interface gráfica:
+
+    python -m jobshop solve instancia.json --metodo tabu --tempo-limite 10 --saida cronograma.csv
+    python -m jobshop bench --max-avaliacoes 20000 --saida atual.json --base base.json
+
+Os solvers são importados só depois de ler os argumentos (o pacote é
+carregado sob demanda), então `--help` e erros de uso respondem na hora.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+METODOS = ("subida", "subida_tentativas", "tempera", "tabu", "ag", "ilhas")
+
+METODOS_COM_PERFIL = ("subida", "subida_tentativas", "tempera", "ag")
+
+
+def _positivo(tipo):
+    """Tipo do argparse que só aceita valores maiores que zero"""
+    def converter(texto):
+        valor = tipo(texto)
+        if valor <= 0:
+            raise argparse.ArgumentTypeError(f"deve ser maior que zero: {texto}")
+        return valor
+    converter.__name__ = tipo.__name__
+    return converter
+
+def _resolver(problema, argumentos, perfil=None):
+    from .aleatorio import como_gerador
+    from .cronograma import cronograma_aleatorio
+
+    rng = como_gerador(argumentos.semente)
+    comuns = dict(tempo_limite=argumentos.tempo_limite, max_avaliacoes=argumentos.max_avaliacoes, semente=rng)
+    if perfil is not None:
+        comuns["perfil"] = perfil
+    if argumentos.metodo in ("ag", "ilhas"):
+        from .genetico import algoritmo_genetico_simples
+        from .ilhas import algoritmo_genetico_ilhas
+
+        parametros = dict(tp=argumentos.tp, ng=argumentos.ng, workers=argumentos.workers, **comuns)
+        if argumentos.metodo == "ilhas":
+            cronograma, makespan, _, _ = algoritmo_genetico_ilhas(problema, n_ilhas=argumentos.ilhas, **parametros)
+        else:
+            cronograma, makespan, _, _ = algoritmo_genetico_simples(problema, **parametros)
+        return cronograma, makespan
+
+    from .portfolio import METODOS_LOCAIS
+
+    parametros = dict(comuns, vizinhanca=argumentos.vizinhanca)
+    if argumentos.metodo == "tabu" and argumentos.tempo_limite is not None:
+        parametros["max_iteracoes"] = sys.maxsize  # com prazo, quem para é o tempo
+    return METODOS_LOCAIS[argumentos.metodo](problema, cronograma_aleatorio(problema, rng), **parametros)
+
+def _solve(argumentos):
+    from .arquivos import ler_instancia, salvar_cronograma
+
+    if argumentos.metodo in ("ag", "ilhas") and argumentos.ng is None \
+            and argumentos.tempo_limite is None and argumentos.max_avaliacoes is None:
+        argumentos.ng = 50
+
+    perfil = None
+    if argumentos.perfil:
+        if argumentos.metodo not in METODOS_COM_PERFIL:
+            raise ValueError(f"--perfil vale para {', '.join(METODOS_COM_PERFIL)}")
+        from .perfil import Perfil
+
+        perfil = Perfil()
+
+    problema = ler_instancia(argumentos.instancia, argumentos.formato, argumentos.nome)
+    inicio = time.perf_counter()
+    cronograma, makespan = _resolver(problema, argumentos, perfil)
+    tempo = time.perf_counter() - inicio
+
+    if perfil is not None:
+        perfil.salvar(argumentos.perfil)
+    if argumentos.saida:
+        salvar_cronograma(cronograma, argumentos.saida, makespan)
+    else:
+        json.dump({"makespan": makespan, "cronograma": cronograma}, sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+    from .benchmarks import MELHORES_CONHECIDOS
+    nome = argumentos.nome or os.path.splitext(os.path.basename(argumentos.instancia))[0]
+    referencia = MELHORES_CONHECIDOS.get(nome.lower())
+    print(f"{argumentos.metodo}: makespan {makespan} em {tempo:.2f}s "
+          f"(limite inferior {problema.limite_inferior()}"
+          + (f", melhor conhecido {referencia}" if referencia else "") + ")", file=sys.stderr)
+    return 0
+
+def _bench(argumentos):
+    from .benchmarks import ler_benchmark
+    from .desempenho import (executar_suite, instancias_padrao, resumir, salvar_resultados,
+                             carregar_resultados, comparar_com_base)
+
+    if argumentos.tempo_limite is None and argumentos.max_avaliacoes is None:
+        argumentos.tempo_limite = 1.0
+    instancias = instancias_padrao()
+    if argumentos.instancias:
+        instancias = [i for caminho in argumentos.instancias for i in ler_benchmark(caminho)]
+
+    def mostrar(r):
+        print(f"{r['instancia']:>10} {r['metodo']:>18} semente {r['semente']}: makespan {r['makespan']} "
+              f"(gap {r['gap']:.1f}%), {r['avaliacoes_por_s'] or 0:.0f} aval/s", file=sys.stderr)
+
+    resultados = executar_suite(instancias, argumentos.metodos, range(argumentos.sementes),
+                                argumentos.tempo_limite, argumentos.max_avaliacoes, progresso=mostrar)
+    if argumentos.saida:
+        salvar_resultados(resultados, argumentos.saida)
+    else:
+        json.dump(resumir(resultados), sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+
+    if argumentos.base:
+        regressoes = comparar_com_base(resultados, carregar_resultados(argumentos.base))
+        for r in regressoes:
+            print(f"REGRESSÃO {r['instancia'] or '(todas)'} {r['metodo']} {r['medida']}: {r['base']} -> {r['atual']}", file=sys.stderr)
+        if regressoes:
+            return 1
+    return 0
+
+def criar_parser():
+    parser = argparse.ArgumentParser(prog="python -m jobshop", description="Job shop scheduling sem interface gráfica")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    solve = comandos.add_parser("solve", help="resolve uma instância e grava o cronograma")
+    solve.add_argument("instancia", help="arquivo da instância: JSON (lista de jobs [[máquina, duração], ...]), "
+                                         "OR-Library ou Taillard")
+    solve.add_argument("--formato", choices=("json", "orlib", "taillard"),
+                       help="formato do arquivo (padrão: pela extensão/conteúdo)")
+    solve.add_argument("--nome", help="instância a usar num arquivo com várias (ex.: ft10 no jobshop1.txt)")
+    solve.add_argument("--metodo", choices=METODOS, default="tabu")
+    solve.add_argument("--vizinhanca", choices=("aleatoria", "n5", "n7"), default="n5",
+                       help="vizinhança das buscas locais (padrão: n5)")
+    solve.add_argument("--tempo-limite", type=_positivo(float), help="segundos de busca")
+    solve.add_argument("--max-avaliacoes", type=_positivo(int), help="limite de avaliações")
+    solve.add_argument("--tp", type=_positivo(int), default=30, help="tamanho da população (ag/ilhas)")
+    solve.add_argument("--ng", type=_positivo(int), help="número de gerações (ag/ilhas; padrão 50 sem orçamento)")
+    solve.add_argument("--ilhas", type=_positivo(int), default=4, help="número de ilhas (ilhas)")
+    solve.add_argument("--workers", type=_positivo(int), help="processos para ag/ilhas")
+    solve.add_argument("--semente", type=int, help="semente aleatória, para repetir o resultado")
+    solve.add_argument("--saida", help="arquivo de saída .csv ou .json (padrão: JSON na saída padrão)")
+    solve.add_argument("--perfil", metavar="ARQUIVO",
+                       help=f"grava em JSON contadores e tempo por fase ({', '.join(METODOS_COM_PERFIL)})")
+    solve.set_defaults(executar=_solve)
+
+    bench = comandos.add_parser("bench", help="suíte de benchmark: qualidade e velocidade dos solvers")
+    bench.add_argument("instancias", nargs="*", help="arquivos OR-Library/Taillard (padrão: ft06 e aleatórias fixas)")
+    bench.add_argument("--metodos", nargs="+", choices=METODOS, default=["subida_tentativas", "tempera", "tabu", "ag"])
+    bench.add_argument("--sementes", type=_positivo(int), default=3, help="execuções por método e instância (sementes 0..n-1)")
+    bench.add_argument("--tempo-limite", type=_positivo(float), help="segundos por execução (padrão 1 sem --max-avaliacoes)")
+    bench.add_argument("--max-avaliacoes", type=_positivo(int), help="avaliações por execução (resultado independe da máquina)")
+    bench.add_argument("--saida", help="JSON com todas as execuções (padrão: resumo na saída padrão)")
+    bench.add_argument("--base", help="JSON de uma execução anterior; sai com código 1 se houver regressão")
+    bench.set_defaults(executar=_bench)
+    return parser
+
+def main(argv=None):
+    argumentos = criar_parser().parse_args(argv)
+    try:
+        return argumentos.executar(argumentos)
+    except (OSError, ValueError) as erro:
+        print(f"erro: {erro}", file=sys.stderr)
+        return 1
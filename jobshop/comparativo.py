@@ -0,0 +1,49 @@
+import time
+from . import paralelo
+from .problema import como_problema
+from .genetico import algoritmo_genetico_simples
+from .portfolio import METODOS_LOCAIS
+
+
+def _ag(dados, solucao_inicial, **parametros):
+    # O AG parte da própria população, não da solução inicial
+    cronograma, makespan, _, _ = algoritmo_genetico_simples(dados, **parametros)
+    return cronograma, makespan
+
+METODOS_COMPARATIVO = dict(METODOS_LOCAIS, ag=_ag)
+
+
+def _executar_tarefa(tarefa, problema, solucao_inicial):
+    rotulo, metodo, parametros, semente = tarefa
+    inicio = time.perf_counter()
+    cronograma, makespan = METODOS_COMPARATIVO[metodo](problema, solucao_inicial, semente=semente, **parametros)
+    return {
+        "rotulo": rotulo,
+        "metodo": metodo,
+        "makespan": makespan,
+        "tempo": time.perf_counter() - inicio,
+        "cronograma": cronograma,
+    }
+
+def _executar_tarefa_worker(tarefa, solucao_inicial):
+    return _executar_tarefa(tarefa, paralelo._problema_worker, solucao_inicial)
+
+def executar_comparativo(dados, solucao_inicial, tarefas, workers=None, semente=0):
+    """
+    Executa os métodos do relatório comparativo, em paralelo com workers > 1.
+    tarefas: [(rótulo, método, parâmetros), ...], método em METODOS_COMPARATIVO.
+    Cada tarefa roda com a mesma `semente`, então o resultado não depende de
+    rodar em série ou em paralelo. Retorna um dict por tarefa, na ordem dada,
+    com makespan, cronograma e tempo de parede (s).
+    """
+    problema = como_problema(dados)
+    desconhecidos = [m for _, m, _ in tarefas if m not in METODOS_COMPARATIVO]
+    if desconhecidos:
+        raise ValueError(f"Métodos desconhecidos: {desconhecidos}")
+    tarefas = [(rotulo, metodo, dict(parametros), semente) for rotulo, metodo, parametros in tarefas]
+
+    if workers is None or workers <= 1 or len(tarefas) < 2:
+        return [_executar_tarefa(t, problema, solucao_inicial) for t in tarefas]
+    with paralelo.usar_pool(problema, workers) as pool:
+        futuros = [pool.submit(_executar_tarefa_worker, t, solucao_inicial) for t in tarefas]
+        return [f.result() for f in futuros]
@@ -0,0 +1,203 @@
+import numpy as np
+from .problema import como_problema
+from .vizinhanca import SequenciaMaquinas
+from .grafo import decodificar_sequencia
+from .aleatorio import como_gerador
+
+
+def avalia(cronograma):
+    if not cronograma:
+        return 0
+    tempos_finais = [op["Fim"] for op in cronograma]
+    makespan = max(tempos_finais)
+    return makespan
+
+def cronograma_aleatorio(dados, semente=None):
+    """Cronograma viável a partir de uma ordem aleatória das operações"""
+    problema = como_problema(dados)
+
+    # Ordem aleatória das operações; cada job executa as suas na ordem da rota
+    todas_operacoes = como_gerador(semente).permutation(problema.total_ops)
+    return decodificar_individuo_simples((todas_operacoes // problema.n_ops).tolist(), problema)
+
+def gerar_solucao_inicial_aleatoria(dados, tamanho_problema, semente=None):
+    import pandas as pd  # só para a tabela da interface; o resto do pacote não depende do pandas
+
+    problema = como_problema(dados)
+    cronograma = cronograma_aleatorio(problema, semente)
+
+    dados_formatados = [[f"{maquina} - {tempo}" for maquina, tempo in linha] for linha in problema.para_dados()]
+    df = pd.DataFrame(dados_formatados, columns=[f"Op{i+1}" for i in range(problema.n_ops)], index=[f"J{i+1}" for i in range(tamanho_problema)])
+
+    return cronograma, df
+
+def construir_lista_por_maquina(dados):
+    """Sequência de operações (índices planos) de cada máquina, na ordem dos jobs"""
+    problema = como_problema(dados)
+    return SequenciaMaquinas.do_problema(problema)
+
+def sequencia_do_cronograma(dados, cronograma):
+    """Sequência de cada máquina na ordem de início de um cronograma já montado"""
+    problema = como_problema(dados)
+    if len(cronograma) != problema.total_ops:
+        return construir_lista_por_maquina(problema)
+    ids = {nome: m for m, nome in enumerate(problema.maquinas)}
+    listas = [[] for _ in range(problema.n_maquinas)]
+    for item in cronograma:
+        op = (int(item["Job"][1:]) - 1) * problema.n_ops + int(item["Operação"][2:]) - 1
+        listas[ids[item["Máquina"]]].append((item["Início"], item["Fim"], op))
+    return SequenciaMaquinas.de_listas([[op for _, _, op in sorted(ops)] for ops in listas])
+
+def _como_sequencia(maquina_ops):
+    if isinstance(maquina_ops, SequenciaMaquinas):
+        return maquina_ops
+    return SequenciaMaquinas.de_listas(maquina_ops)
+
+def construir_cronograma(dados, maquina_ops, makespan_only=False):
+    """
+    Monta o cronograma semi-ativo a partir da sequência de cada máquina,
+    respeitando a precedência dos jobs (sequências com ciclo são reparadas).
+    Com makespan_only=True retorna apenas o makespan, sem montar os dicionários.
+    """
+    problema = como_problema(dados)
+    return decodificar_sequencia(problema, _como_sequencia(maquina_ops), makespan_only=makespan_only)
+
+def decodificar_individuo_simples(individuo, dados, makespan_only=False):
+    """
+    Decodifica um indivíduo em cronograma detalhado.
+    Retorna lista de dicionários: Job, Operação, Máquina, Início, Fim
+    (ou apenas o makespan, com makespan_only=True)
+    """
+    problema = como_problema(dados)
+    if makespan_only:
+        return _makespan_individuo(problema, individuo)
+    n_ops = problema.n_ops
+    maquinas = problema.lista_maquina
+    duracoes = problema.lista_duracao
+    cronograma = []
+    tempo_maquinas = [0] * problema.n_maquinas
+    tempo_jobs = [0] * problema.n_jobs
+    contagem_ops = [0] * problema.n_jobs
+
+    # 1. Percorre cromossomo
+    for job_idx in individuo:
+        op_idx = contagem_ops[job_idx]
+        if op_idx < n_ops:
+            op = job_idx * n_ops + op_idx
+            maquina = maquinas[op]
+            inicio = max(tempo_maquinas[maquina], tempo_jobs[job_idx])
+            fim = inicio + duracoes[op]
+            tempo_maquinas[maquina] = fim
+            tempo_jobs[job_idx] = fim
+            contagem_ops[job_idx] += 1
+            cronograma.append({
+                "Job": f"J{job_idx+1}",
+                "Operação": f"Op{op_idx+1}",
+                "Máquina": problema.maquinas[maquina],
+                "Início": inicio,
+                "Fim": fim
+            })
+
+    # 2. Força inclusão das operações restantes (se o cromossomo não percorreu todas)
+    for job_idx in range(problema.n_jobs):
+        while contagem_ops[job_idx] < n_ops:
+            op_idx = contagem_ops[job_idx]
+            op = job_idx * n_ops + op_idx
+            maquina = maquinas[op]
+            inicio = max(tempo_maquinas[maquina], tempo_jobs[job_idx])
+            fim = inicio + duracoes[op]
+            tempo_maquinas[maquina] = fim
+            tempo_jobs[job_idx] = fim
+            contagem_ops[job_idx] += 1
+            cronograma.append({
+                "Job": f"J{job_idx+1}",
+                "Operação": f"Op{op_idx+1}",
+                "Máquina": problema.maquinas[maquina],
+                "Início": inicio,
+                "Fim": fim
+            })
+
+    return cronograma
+
+def _makespan_individuo(problema, individuo):
+    n_ops = problema.n_ops
+    maquinas = problema.lista_maquina
+    duracoes = problema.lista_duracao
+    tempo_maquinas = [0] * problema.n_maquinas
+    tempo_jobs = [0] * problema.n_jobs
+    contagem_ops = [0] * problema.n_jobs
+
+    for job_idx in individuo:
+        op_idx = contagem_ops[job_idx]
+        if op_idx < n_ops:
+            op = job_idx * n_ops + op_idx
+            maquina = maquinas[op]
+            fim = max(tempo_maquinas[maquina], tempo_jobs[job_idx]) + duracoes[op]
+            tempo_maquinas[maquina] = fim
+            tempo_jobs[job_idx] = fim
+            contagem_ops[job_idx] = op_idx + 1
+
+    # Operações que o cromossomo não percorreu
+    for job_idx in range(problema.n_jobs):
+        tempo = tempo_jobs[job_idx]
+        for op in range(job_idx * n_ops + contagem_ops[job_idx], (job_idx + 1) * n_ops):
+            maquina = maquinas[op]
+            tempo = max(tempo_maquinas[maquina], tempo) + duracoes[op]
+            tempo_maquinas[maquina] = tempo
+        tempo_jobs[job_idx] = tempo
+
+    return max(tempo_jobs, default=0)
+
+def makespan_populacao(pop, dados):
+    """
+    Makespan de toda a população de uma vez (tp × total_ops), sem montar cronogramas.
+    Percorre as posições do cromossomo aplicando a mesma regra de
+    decodificar_individuo_simples a todos os indivíduos em paralelo.
+    """
+    problema = como_problema(dados)
+    pop = np.asarray(pop, dtype=np.int64)
+    if pop.size == 0:
+        pop = pop.reshape(0, problema.total_ops)
+    if pop.ndim != 2:
+        raise ValueError("A população deve ser uma matriz tp × total_ops")
+    tp, tamanho = pop.shape
+    n_ops = problema.n_ops
+    maquina_op = problema.maquina_op.astype(np.int64)
+    duracao_op = problema.duracao_op.astype(np.int64)
+
+    # Estado de todos os indivíduos em vetores planos (indivíduo × máquina / indivíduo × job)
+    linhas = np.arange(tp, dtype=np.int64)
+    base_maq = linhas * problema.n_maquinas
+    base_job = linhas * problema.n_jobs
+    tempo_maquinas = np.zeros(tp * problema.n_maquinas, dtype=np.int64)
+    tempo_jobs = np.zeros(tp * problema.n_jobs, dtype=np.int64)
+    contagem_ops = np.zeros(tp * problema.n_jobs, dtype=np.int64)
+
+    def agendar(jobs, k, bm, ij):
+        op = jobs * n_ops + k
+        im = bm + maquina_op[op]
+        fim = np.maximum(tempo_maquinas[im], tempo_jobs[ij]) + duracao_op[op]
+        tempo_maquinas[im] = fim
+        tempo_jobs[ij] = fim
+        contagem_ops[ij] = k + 1
+
+    # 1. Percorre cromossomo
+    for pos in range(tamanho):
+        jobs = pop[:, pos]
+        ij = base_job + jobs
+        k = contagem_ops[ij]
+        valido = k < n_ops
+        if valido.all():
+            agendar(jobs, k, base_maq, ij)
+        else:
+            agendar(jobs[valido], k[valido], base_maq[valido], ij[valido])
+
+    # 2. Força inclusão das operações restantes (se o cromossomo não percorreu todas)
+    for job_idx in range(problema.n_jobs):
+        ij = base_job + job_idx
+        for k in range(n_ops):
+            falta = contagem_ops[ij] == k
+            if falta.any():
+                agendar(np.full(falta.sum(), job_idx), k, base_maq[falta], ij[falta])
+
+    return tempo_jobs.reshape(tp, problema.n_jobs).max(axis=1, initial=0)
@@ -0,0 +1,196 @@
+"""
+Suíte de benchmark reproduzível: roda cada solver num conjunto fixo de
+instâncias, com sementes e orçamento fixos, e mede qualidade e velocidade.
+
+    python -m jobshop bench --tempo-limite 2 --saida atual.json --base base.json
+
+Cada execução registra makespan, gap para o melhor conhecido (ou para o limite
+inferior, se não houver), avaliações por segundo e tempo até o alvo. Com
+--max-avaliacoes no lugar de --tempo-limite os makespans não dependem da
+máquina, o que torna a comparação com a base exata.
+"""
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+import numpy as np
+from .benchmarks import Instancia, MELHORES_CONHECIDOS
+from .cronograma import cronograma_aleatorio
+from .orcamento import Orcamento
+from .problema import Problema, como_problema, gerar_problema_aleatorio
+from .aleatorio import como_gerador
+
+# ft06 (Fisher e Thompson), pares (máquina, duração) por job
+_FT06 = [
+    [2, 1, 0, 3, 1, 6, 3, 7, 5, 3, 4, 6],
+    [1, 8, 2, 5, 4, 10, 5, 10, 0, 10, 3, 4],
+    [2, 5, 3, 4, 5, 8, 0, 9, 1, 1, 4, 7],
+    [1, 5, 0, 5, 2, 5, 3, 3, 4, 8, 5, 9],
+    [2, 9, 1, 3, 4, 5, 5, 4, 0, 3, 3, 1],
+    [1, 3, 3, 3, 5, 9, 0, 10, 4, 4, 2, 1],
+]
+# Instâncias aleatórias fixas: (nome, jobs, máquinas, semente)
+_ALEATORIAS = [("r10x5", 10, 5, 1), ("r15x10", 15, 10, 2), ("r20x15", 20, 15, 3)]
+
+METODOS_SUITE = ("subida_tentativas", "tempera", "tabu", "ag")
+
+
+def instancias_padrao():
+    """Conjunto fixo da suíte: ft06 e três instâncias aleatórias de semente fixa"""
+    pares = np.array(_FT06).reshape(6, 6, 2)
+    instancias = [Instancia("ft06", Problema(pares[:, :, 0], pares[:, :, 1]), MELHORES_CONHECIDOS["ft06"])]
+    for nome, n_jobs, n_maquinas, semente in _ALEATORIAS:
+        instancias.append(Instancia(nome, como_problema(gerar_problema_aleatorio(n_jobs, n_maquinas, semente)), None))
+    return instancias
+
+def _rodar_metodo(metodo, problema, orcamento, progresso, rng):
+    """Executa um solver com o orçamento dado; retorna (makespan, avaliações)"""
+    if metodo in ("ag", "ilhas"):
+        from .genetico import algoritmo_genetico_simples
+        from .ilhas import algoritmo_genetico_ilhas
+
+        segundos, avaliacoes = orcamento.restante()
+        solver = algoritmo_genetico_ilhas if metodo == "ilhas" else algoritmo_genetico_simples
+        _, makespan, _, estatisticas = solver(problema, ng=None, tempo_limite=segundos,
+                                              max_avaliacoes=avaliacoes, progresso=progresso, semente=rng)
+        return makespan, estatisticas["avaliacoes"]
+
+    from .portfolio import METODOS_LOCAIS
+
+    # Vizinhança N5 em todas, como na linha de comando
+    parametros = {"max_iteracoes": sys.maxsize} if metodo == "tabu" else {}
+    solucao_inicial = cronograma_aleatorio(problema, rng)
+    _, makespan = METODOS_LOCAIS[metodo](problema, solucao_inicial, progresso=progresso, orcamento=orcamento,
+                                         semente=rng, vizinhanca="n5", **parametros)
+    return makespan, orcamento.avaliacoes
+
+def executar_execucao(instancia, metodo, semente, tempo_limite=None, max_avaliacoes=None, tolerancia=0.05):
+    """
+    Uma execução da suíte. O alvo é o melhor conhecido (ou o limite inferior)
+    acrescido de `tolerancia`; tempo_alvo é quando ele foi atingido (None = não foi).
+    """
+    problema = instancia.problema
+    limite_inferior = problema.limite_inferior()
+    referencia = instancia.melhor_conhecido or limite_inferior
+    alvo = math.floor(referencia * (1 + tolerancia))
+    atingido = []
+
+    rng = como_gerador(semente)
+    orcamento = Orcamento(tempo_limite, max_avaliacoes)
+    inicio = time.perf_counter()
+
+    def progresso(historico):
+        if not atingido and historico[-1] <= alvo:
+            atingido.append(time.perf_counter() - inicio)
+
+    makespan, avaliacoes = _rodar_metodo(metodo, problema, orcamento, progresso, rng)
+    tempo = time.perf_counter() - inicio
+    return {
+        "instancia": instancia.nome,
+        "metodo": metodo,
+        "semente": semente,
+        "makespan": int(makespan),
+        "melhor_conhecido": instancia.melhor_conhecido,
+        "limite_inferior": limite_inferior,
+        "gap": round(100 * (makespan - referencia) / referencia, 3),
+        "alvo": alvo,
+        "tempo_alvo": round(atingido[0], 4) if atingido else None,
+        "avaliacoes": int(avaliacoes),
+        "avaliacoes_por_s": round(avaliacoes / tempo, 1) if tempo > 0 else None,
+        "tempo": round(tempo, 4),
+    }
+
+def executar_suite(instancias=None, metodos=METODOS_SUITE, sementes=(0, 1, 2), tempo_limite=1.0,
+                   max_avaliacoes=None, tolerancia=0.05, progresso=None):
+    """
+    Roda cada método em cada instância com cada semente, em série (para que as
+    medidas de velocidade não disputem núcleos). progresso(resultado) é chamado
+    após cada execução. Retorna {"parametros": ..., "ambiente": ..., "execucoes": [...]}.
+    """
+    if tempo_limite is None and max_avaliacoes is None:
+        raise ValueError("A suíte precisa de tempo_limite ou max_avaliacoes")
+    instancias = instancias_padrao() if instancias is None else list(instancias)
+    execucoes = []
+    for instancia in instancias:
+        for metodo in metodos:
+            for semente in sementes:
+                resultado = executar_execucao(instancia, metodo, semente, tempo_limite, max_avaliacoes, tolerancia)
+                execucoes.append(resultado)
+                if progresso is not None:
+                    progresso(resultado)
+    return {
+        "parametros": {
+            "metodos": list(metodos),
+            "sementes": list(sementes),
+            "tempo_limite": tempo_limite,
+            "max_avaliacoes": max_avaliacoes,
+            "tolerancia": tolerancia,
+        },
+        "ambiente": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+        },
+        "execucoes": execucoes,
+    }
+
+def _velocidade(execucoes):
+    # Total de avaliações sobre o tempo total: execuções curtas pesam menos que na média das taxas
+    tempo = sum(e["tempo"] for e in execucoes)
+    return round(sum(e["avaliacoes"] for e in execucoes) / tempo, 1) if tempo > 0 else 0.0
+
+def resumir(resultados):
+    """Agrega as execuções por (instância, método): médias de makespan, gap e velocidade"""
+    grupos = {}
+    for execucao in resultados["execucoes"]:
+        grupos.setdefault((execucao["instancia"], execucao["metodo"]), []).append(execucao)
+    resumo = []
+    for (instancia, metodo), execucoes in grupos.items():
+        tempos_alvo = [e["tempo_alvo"] for e in execucoes if e["tempo_alvo"] is not None]
+        resumo.append({
+            "instancia": instancia,
+            "metodo": metodo,
+            "makespan_medio": statistics.mean(e["makespan"] for e in execucoes),
+            "melhor_makespan": min(e["makespan"] for e in execucoes),
+            "gap_medio": round(statistics.mean(e["gap"] for e in execucoes), 3),
+            "avaliacoes_por_s": _velocidade(execucoes),
+            "taxa_alvo": len(tempos_alvo) / len(execucoes),
+            "tempo_alvo_mediano": statistics.median(tempos_alvo) if tempos_alvo else None,
+        })
+    return resumo
+
+def salvar_resultados(resultados, caminho):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(resultados, arquivo, ensure_ascii=False, indent=2)
+
+def carregar_resultados(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+def comparar_com_base(resultados, base, tolerancia_makespan=0.01, tolerancia_velocidade=0.2):
+    """
+    Compara com uma execução anterior da suíte. Regressão: makespan médio de um
+    (instância, método) pior que a base em mais de tolerancia_makespan (relativo),
+    ou avaliações por segundo de um método, somadas as instâncias em comum, abaixo
+    da base em mais de tolerancia_velocidade (por método, para diluir o ruído de
+    execuções curtas). Retorna a lista de regressões, cada uma um dict com o que piorou.
+    """
+    anteriores = {(r["instancia"], r["metodo"]): r for r in resumir(base)}
+    regressoes = []
+    for atual in resumir(resultados):
+        anterior = anteriores.get((atual["instancia"], atual["metodo"]))
+        if anterior is not None and atual["makespan_medio"] > anterior["makespan_medio"] * (1 + tolerancia_makespan):
+            regressoes.append({"instancia": atual["instancia"], "metodo": atual["metodo"], "medida": "makespan_medio",
+                               "base": anterior["makespan_medio"], "atual": atual["makespan_medio"]})
+
+    comuns = {(e["instancia"], e["metodo"]) for e in base["execucoes"]} & \
+        {(e["instancia"], e["metodo"]) for e in resultados["execucoes"]}
+    for metodo in sorted({m for _, m in comuns}):
+        velocidades = [_velocidade([e for e in r["execucoes"] if (e["instancia"], e["metodo"]) in comuns
+                                    and e["metodo"] == metodo]) for r in (base, resultados)]
+        if velocidades[0] and velocidades[1] < velocidades[0] * (1 - tolerancia_velocidade):
+            regressoes.append({"instancia": None, "metodo": metodo, "medida": "avaliacoes_por_s",
+                               "base": velocidades[0], "atual": velocidades[1]})
+    return regressoes
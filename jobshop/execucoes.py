@@ -0,0 +1,82 @@
+import threading
+import uuid
+
+# Execuções em segundo plano de todas as sessões, por id; sobrevivem aos reruns
+# do Streamlit porque o módulo só é importado uma vez por processo. Execuções
+# simultâneas com workers > 1 não disputam um pool único: cada (problema,
+# processos) tem o seu, reservado por paralelo.usar_pool até o solver terminar
+_execucoes = {}
+_trava = threading.Lock()
+_MAX_TERMINADAS = 32
+
+
+class ExecucaoSegundoPlano:
+    """
+    Roda um solver numa thread, passando progresso=... para ele. O histórico
+    parcial fica em `historico` a cada chamada do solver; cancelar() faz o
+    solver parar na próxima chamada e devolver o melhor encontrado até ali.
+    """
+
+    def __init__(self, funcao, args, kwargs):
+        self.id = uuid.uuid4().hex
+        self.historico = []
+        self.estado = "executando"
+        self.resultado = None
+        self.erro = None
+        self._cancelar = threading.Event()
+        self._thread = threading.Thread(
+            target=self._executar, args=(funcao, args, kwargs),
+            name=f"jobshop-{self.id[:8]}", daemon=True,
+        )
+        self._thread.start()
+
+    def _progresso(self, historico):
+        self.historico = list(historico)
+        return self._cancelar.is_set()
+
+    def _executar(self, funcao, args, kwargs):
+        try:
+            self.resultado = funcao(*args, progresso=self._progresso, **kwargs)
+            self.estado = "cancelada" if self._cancelar.is_set() else "concluida"
+        except Exception as erro:
+            self.erro = erro
+            self.estado = "erro"
+
+    @property
+    def ativa(self):
+        return self.estado == "executando"
+
+    @property
+    def melhor(self):
+        """Melhor makespan até agora (None antes da primeira chamada de progresso)"""
+        return self.historico[-1] if self.historico else None
+
+    def cancelar(self):
+        self._cancelar.set()
+
+    def aguardar(self, tempo=None):
+        self._thread.join(tempo)
+        return not self.ativa
+
+
+def iniciar_execucao(funcao, *args, **kwargs):
+    """Inicia funcao(*args, progresso=..., **kwargs) em segundo plano e retorna o id"""
+    execucao = ExecucaoSegundoPlano(funcao, args, kwargs)
+    with _trava:
+        _execucoes[execucao.id] = execucao
+        # Descarta as terminadas mais antigas que ninguém veio buscar
+        terminadas = [i for i, e in _execucoes.items() if not e.ativa]
+        for i in terminadas[:max(0, len(terminadas) - _MAX_TERMINADAS)]:
+            del _execucoes[i]
+    return execucao.id
+
+def obter_execucao(id_execucao):
+    with _trava:
+        return _execucoes.get(id_execucao)
+
+def descartar_execucao(id_execucao):
+    """Remove a execução do registro, cancelando-a se ainda estiver rodando"""
+    with _trava:
+        execucao = _execucoes.pop(id_execucao, None)
+    if execucao is not None:
+        execucao.cancelar()
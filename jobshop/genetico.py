@@ -0,0 +1,416 @@
+import itertools
+import time
+from contextlib import nullcontext
+import numpy as np
+from .problema import como_problema
+from .cronograma import decodificar_individuo_simples
+from .paralelo import makespan_populacao_paralelo, usar_pool
+from .cache import CacheAptidao
+from .grafo import AvaliadorIncremental
+from .busca_local import descida_critica
+from .vizinhanca import SequenciaMaquinas
+from .orcamento import Orcamento
+from .aleatorio import como_gerador
+
+
+def _populacao_inicial(problema, tamanho_pop, rng):
+    """Matriz tamanho_pop × total_ops: cada linha embaralha o cromossomo base (uma chamada para todas)"""
+    cromossomo_base = problema.job_op  # cada job aparece tantas vezes quanto suas operações
+    return rng.permuted(np.tile(cromossomo_base, (tamanho_pop, 1)), axis=1)
+
+def pop_ini_jobshop(dados, tamanho_pop, semente=None):
+    return _populacao_inicial(como_problema(dados), tamanho_pop, como_gerador(semente)).tolist()
+
+
+def aptidao_jobshop_simples(pop, dados, workers=None):
+    """Calcula aptidão (versão simplificada); workers > 1 avalia em processos paralelos"""
+    makespans = makespan_populacao_paralelo(pop, como_problema(dados), workers)
+    return aptidao_de_makespans(makespans)
+
+def aptidao_de_makespans(makespans):
+    """Aptidão normalizada a partir de makespans já calculados (sem decodificar)"""
+    makespans = np.asarray(makespans)
+    # Quanto menor o makespan, melhor (usar 1/makespan)
+    fit = np.divide(1.0, makespans, out=np.zeros(len(makespans)), where=makespans > 0).tolist()
+    
+    # Normalizar
+    soma = sum(fit)
+    if soma > 0:
+        fit = [f / soma for f in fit]
+    else:
+        fit = [1.0 / len(fit) for _ in fit]
+    
+    return fit
+
+def selecao_roleta_simples(fit, semente=None):
+    """Seleção por roleta (versão simplificada)"""
+    if not fit:
+        return 0
+    
+    rng = como_gerador(semente)
+    soma = sum(fit)
+    if soma == 0:
+        return int(rng.integers(0, len(fit)))
+    
+    ale = rng.random() * soma
+    acumulado = 0
+    
+    for i, f in enumerate(fit):
+        acumulado += f
+        if acumulado >= ale:
+            return i
+    
+    return len(fit) - 1
+
+def selecao_roleta(fit, n, rng):
+    """Roleta vetorizada: acumulada uma vez e n sorteios por busca binária"""
+    acumulado = np.cumsum(fit)
+    if len(acumulado) == 0 or acumulado[-1] <= 0:
+        return rng.integers(0, max(len(fit), 1), n)
+    sorteios = rng.random(n) * acumulado[-1]
+    return np.minimum(np.searchsorted(acumulado, sorteios), len(fit) - 1)
+
+def selecao_torneio(fit, n, rng, tamanho=3):
+    """Torneio: o mais apto entre `tamanho` sorteados, para cada um dos n pais"""
+    fit = np.asarray(fit)
+    candidatos = rng.integers(0, len(fit), (n, tamanho))
+    return candidatos[np.arange(n), np.argmax(fit[candidatos], axis=1)]
+
+def selecao_ranking(fit, n, rng):
+    """Ranking linear: roleta sobre a posição (1 = pior, tp = melhor), não sobre a aptidão"""
+    posicao = np.empty(len(fit))
+    posicao[np.argsort(fit, kind="stable")] = np.arange(1, len(fit) + 1)
+    return selecao_roleta(posicao, n, rng)
+
+SELECOES = {
+    "roleta": selecao_roleta,
+    "torneio": selecao_torneio,
+    "ranking": selecao_ranking,
+}
+
+def cruzamento_ponto_unico(pai1, pai2, semente=None):
+    """Cruzamento em ponto único"""
+    n = len(pai1)
+    
+    if n < 2:
+        return pai1.copy(), pai2.copy()
+    
+    ponto = int(como_gerador(semente).integers(1, n))
+    
+    filho1 = pai1[:ponto] + pai2[ponto:]
+    filho2 = pai2[:ponto] + pai1[ponto:]
+    
+    return filho1, filho2
+
+def mutacao_troca_simples(individuo, semente=None):
+    """Mutação por troca de posições"""
+    n = len(individuo)
+    
+    if n < 2:
+        return individuo
+    
+    # Criar cópia
+    mutado = individuo.copy()
+    
+    # Escolher duas posições diferentes
+    pos1, pos2 = como_gerador(semente).choice(n, 2, replace=False).tolist()
+    
+    # Trocar
+    mutado[pos1], mutado[pos2] = mutado[pos2], mutado[pos1]
+    
+    return mutado
+
+def cruzamento_ponto_unico_lote(pais1, pais2, rng):
+    """Ponto único para um lote de pares (linhas de pais1 × pais2); pode gerar filhos inválidos"""
+    n, tamanho = pais1.shape
+    if tamanho < 2:
+        return pais1.copy(), pais2.copy()
+    antes = np.arange(tamanho) < rng.integers(1, tamanho, n)[:, None]
+    return np.where(antes, pais1, pais2), np.where(antes, pais2, pais1)
+
+def _manter_jobs(fixo, doador, manter, linhas):
+    # Genes dos jobs mantidos ficam no lugar; as demais posições recebem,
+    # na ordem do doador, os genes dos outros jobs. Cada linha tem o mesmo
+    # número de vagas e de genes, então a indexação booleana casa linha a linha.
+    fica = manter[linhas, fixo]
+    filho = fixo.copy()
+    filho[~fica] = doador[~manter[linhas, doador]]
+    return filho
+
+def cruzamento_jox(pais1, pais2, rng):
+    """
+    JOX (job-based order crossover) em lote: sorteia um subconjunto de jobs por par;
+    o filho 1 mantém os genes desses jobs nas posições de pai1 e completa com os
+    demais na ordem de pai2 (filho 2 simétrico). Preserva a contagem de cada job.
+    """
+    n, tamanho = pais1.shape
+    if n == 0 or tamanho < 2:
+        return pais1.copy(), pais2.copy()
+    n_jobs = int(max(pais1.max(), pais2.max())) + 1
+    manter = rng.random((n, n_jobs)) < 0.5
+    linhas = np.arange(n)[:, None]
+    return _manter_jobs(pais1, pais2, manter, linhas), _manter_jobs(pais2, pais1, manter, linhas)
+
+def cruzamento_pox(pais1, pais2, rng):
+    """
+    POX (precedence operation crossover) em lote: divide os jobs em dois grupos não
+    vazios; o filho 1 mantém os genes do grupo 1 nas posições de pai1 e o filho 2
+    os do grupo 2 nas posições de pai2, completando na ordem do outro pai.
+    Mantém a ordem das operações de cada job e a contagem de cada job.
+    """
+    n, tamanho = pais1.shape
+    if n == 0 or tamanho < 2:
+        return pais1.copy(), pais2.copy()
+    n_jobs = int(max(pais1.max(), pais2.max())) + 1
+    grupo1 = rng.random((n, n_jobs)) < 0.5
+    if n_jobs > 1:
+        # Garante os dois grupos não vazios
+        linhas = np.arange(n)
+        grupo1[linhas, rng.integers(0, n_jobs, n)] = True
+        todos = grupo1.all(axis=1)
+        grupo1[linhas[todos], rng.integers(0, n_jobs, todos.sum())] = False
+    linhas = np.arange(n)[:, None]
+    return _manter_jobs(pais1, pais2, grupo1, linhas), _manter_jobs(pais2, pais1, ~grupo1, linhas)
+
+CRUZAMENTOS = {
+    "ponto_unico": cruzamento_ponto_unico_lote,
+    "jox": cruzamento_jox,
+    "pox": cruzamento_pox,
+}
+
+def mutacao_troca_lote(pop, tm, rng):
+    """Mutação por troca em lote: cada indivíduo troca duas posições com probabilidade tm"""
+    n, tamanho = pop.shape
+    if tamanho < 2:
+        return pop
+    mutar = np.flatnonzero(rng.random(n) < tm)
+    pos1 = rng.integers(0, tamanho, len(mutar))
+    pos2 = (pos1 + rng.integers(1, tamanho, len(mutar))) % tamanho
+    pop[mutar, pos1], pop[mutar, pos2] = pop[mutar, pos2], pop[mutar, pos1]
+    return pop
+
+def _operacoes_do_cromossomo(problema, cromossomo):
+    """Operações na ordem em que decodificar_individuo_simples as agenda (inclusive as forçadas no fim)"""
+    n_ops = problema.n_ops
+    contagem = [0] * problema.n_jobs
+    ops = []
+    for job in cromossomo:
+        k = contagem[job]
+        if k < n_ops:
+            ops.append(job * n_ops + k)
+            contagem[job] = k + 1
+    for job in range(problema.n_jobs):
+        ops.extend(range(job * n_ops + contagem[job], (job + 1) * n_ops))
+    return np.array(ops, dtype=np.int32)
+
+def melhorar_cromossomos(problema, pop, makespans, indices, max_avaliacoes=50, vizinhanca="n5"):
+    """
+    Busca local (Lamarckiana) nos indivíduos `indices`: decodifica o cromossomo em
+    sequências de máquina, desce na vizinhança crítica e reescreve o cromossomo
+    na ordem topológica resultante, que decodifica no mesmo cronograma.
+    Altera pop e makespans no lugar; retorna quantos movimentos foram avaliados.
+    """
+    avaliacoes = 0
+    for i in indices:
+        ops = _operacoes_do_cromossomo(problema, pop[i].tolist())
+        # Cada máquina recebe suas operações na ordem em que o cromossomo as agenda
+        ops = ops[np.argsort(problema.maquina_op[ops], kind="stable")]
+        avaliador = AvaliadorIncremental(problema, SequenciaMaquinas(ops, problema.inicio_maquina.tolist()))
+        inicial = avaliador.makespan
+        avaliacoes += descida_critica(avaliador, max_avaliacoes, vizinhanca)
+        if avaliador.makespan < inicial:
+            pop[i] = problema.job_op[avaliador.ordem]
+            makespans[i] = avaliador.makespan
+    return avaliacoes
+
+def _validar_operadores(selecao, cruzamento):
+    if selecao not in SELECOES:
+        raise ValueError(f"selecao deve ser uma de {sorted(SELECOES)}")
+    if cruzamento not in CRUZAMENTOS:
+        raise ValueError(f"cruzamento deve ser um de {sorted(CRUZAMENTOS)}")
+
+def _memetico(fracao_memetica, max_avaliacoes_locais):
+    if not 0 <= fracao_memetica <= 1:
+        raise ValueError("fracao_memetica deve estar entre 0 e 1")
+    if fracao_memetica == 0 or max_avaliacoes_locais <= 0:
+        return None
+    return fracao_memetica, max_avaliacoes_locais
+
+def _criar_avaliador(problema, workers, cache_mb):
+    # Devolve (avaliar(pop) -> makespans, cache ou None)
+    if cache_mb and cache_mb > 0:
+        cache = CacheAptidao(cache_mb)
+        return (lambda p: cache.avaliar(p, problema, workers)), cache
+    return (lambda p: makespan_populacao_paralelo(p, problema, workers)), None
+
+def _novo_estado(problema, tp, rng):
+    """Estado de uma população: matriz tp × total_ops, makespans (None = ainda não avaliada) e melhor até agora"""
+    pop = _populacao_inicial(problema, tp, rng).astype(np.int32, copy=False)
+    return {
+        "pop": pop,
+        "makespans": None,
+        "rng": rng,
+        "melhor_makespan": float('inf'),
+        "melhor_individuo": None,
+        "historico": [],
+        "avaliacoes": 0,
+    }
+
+def _atualizar_melhor(estado, pop, makespans):
+    if len(makespans):
+        i = int(np.argmin(makespans))
+        if makespans[i] < estado["melhor_makespan"]:
+            estado["melhor_makespan"] = int(makespans[i])
+            estado["melhor_individuo"] = pop[i].tolist()
+
+def _avaliar_populacao_inicial(estado, avaliar, orcamento):
+    """Avalia a população ainda não avaliada do estado; com ng=0 a melhor dela é o resultado"""
+    pop = estado["pop"]
+    estado["makespans"] = avaliar(pop)
+    estado["avaliacoes"] += len(pop)
+    orcamento.contar(len(pop))
+    _atualizar_melhor(estado, pop, estado["makespans"])
+
+def _evoluir(estado, problema, geracoes, avaliar, tp, tc, tm, ig, selecao, cruzamento, memetico=None,
+             progresso=None, orcamento=None, perfil=None):
+    """
+    Avança `geracoes` gerações do estado (no lugar; None = até esgotar o orçamento).
+    memetico = (fração, max_avaliacoes) aplica a busca local à fração dos melhores
+    filhos de cada geração. progresso(historico) é chamado após cada geração; se
+    retornar True, para ali. Com `orcamento`, para ao fim da geração que o esgotar.
+    Com `perfil`, cronometra cada fase da geração (seleção, cruzamento, mutação,
+    avaliação, busca local e elitismo).
+    """
+    if orcamento is None:
+        orcamento = Orcamento()
+    medir = perfil is not None
+    selecionar = SELECOES[selecao]
+    cruzar = CRUZAMENTOS[cruzamento]
+    rng = estado["rng"]
+    pop = estado["pop"]
+    if estado["makespans"] is None:
+        _avaliar_populacao_inicial(estado, avaliar, orcamento)
+    makespans = estado["makespans"]
+    fit = aptidao_de_makespans(makespans)
+    n_pares = (tp + 1) // 2
+
+    for geracao in (range(geracoes) if geracoes is not None else itertools.count()):
+        if medir:
+            relogio = time.perf_counter()
+        pais = selecionar(fit, 2 * n_pares, rng)
+        pais1, pais2 = pop[pais[0::2]], pop[pais[1::2]]
+        if medir:
+            relogio = perfil.medir("selecao", relogio)
+        filhos1, filhos2 = pais1.copy(), pais2.copy()
+        cruzados = rng.random(n_pares) < tc
+        if cruzados.any():
+            filhos1[cruzados], filhos2[cruzados] = cruzar(pais1[cruzados], pais2[cruzados], rng)
+        nova_pop = np.stack((filhos1, filhos2), axis=1).reshape(2 * n_pares, -1)[:tp]
+        if medir:
+            relogio = perfil.medir("cruzamento", relogio)
+            perfil.contar("cruzamentos", int(cruzados.sum()))
+        nova_pop = mutacao_troca_lote(nova_pop, tm, rng)
+        if medir:
+            relogio = perfil.medir("mutacao", relogio)
+
+        makespans_desc = avaliar(nova_pop)
+        estado["avaliacoes"] += len(nova_pop)
+        orcamento.contar(len(nova_pop))
+        if medir:
+            relogio = perfil.medir("avaliacao", relogio)
+        if memetico is not None:
+            fracao, max_avaliacoes = memetico
+            n_melhorar = int(np.ceil(fracao * len(nova_pop)))
+            melhores = np.argsort(makespans_desc, kind="stable")[:n_melhorar]
+            makespans_desc = makespans_desc.copy()
+            locais = melhorar_cromossomos(problema, nova_pop, makespans_desc, melhores, max_avaliacoes)
+            estado["avaliacoes_locais"] = estado.get("avaliacoes_locais", 0) + locais
+            orcamento.contar(locais)
+            if medir:
+                relogio = perfil.medir("busca_local", relogio)
+        fit_desc = aptidao_de_makespans(makespans_desc)
+
+        # >>> Aplicar elitismo com IG (os makespans acompanham os indivíduos)
+        elite = int(ig * tp)
+        ordem_pop = sorted(range(len(pop)), key=lambda i: fit[i], reverse=True)[:elite]
+        ordem_desc = sorted(range(len(nova_pop)), key=lambda i: fit_desc[i], reverse=True)[:tp-elite]
+        pop = np.concatenate((pop[ordem_pop], nova_pop[ordem_desc]))
+        makespans = np.concatenate((makespans[ordem_pop], makespans_desc[ordem_desc]))
+        fit = aptidao_de_makespans(makespans)
+
+        _atualizar_melhor(estado, pop, makespans)
+        if medir:
+            perfil.medir("elitismo", relogio)
+            perfil.contar("geracoes")
+            perfil.contar("filhos", len(nova_pop))
+
+        estado["historico"].append(estado["melhor_makespan"])
+        if progresso is not None and progresso(estado["historico"]):
+            estado["interrompido"] = True
+            break
+        if orcamento.esgotado():
+            break
+
+    estado["pop"] = pop
+    estado["makespans"] = makespans
+    return estado
+
+def algoritmo_genetico_simples(dados, tp=30, ng=50, tc=0.8, tm=0.1, ig=0.2, workers=None, cache_mb=16,
+                               selecao="roleta", cruzamento="jox", fracao_memetica=0.0, max_avaliacoes_locais=50,
+                               progresso=None, tempo_limite=None, max_avaliacoes=None, semente=None, perfil=None):
+    """
+    Retorna (cronograma, makespan, historico, estatisticas). O makespan de cada
+    indivíduo anda junto com ele, então cada filho é decodificado uma única vez;
+    com cache_mb > 0, cromossomos repetidos entre gerações vêm do cache LRU.
+    selecao: "roleta", "torneio" ou "ranking" (todos os pais sorteados de uma vez).
+    cruzamento: "jox", "pox" ou "ponto_unico" (aplicado ao lote de pares da geração).
+    fracao_memetica > 0: modo memético, busca local N5 (até max_avaliacoes_locais
+    movimentos) nessa fração dos melhores filhos, gravada de volta no cromossomo.
+    progresso(historico): chamado a cada geração; retornar True interrompe a execução,
+    que devolve o melhor encontrado até ali (estatisticas["interrompido"]).
+    tempo_limite (s) / max_avaliacoes: orçamento; ao esgotar, devolve o melhor até
+    ali. Com orçamento, ng=None roda gerações até ele acabar.
+    semente: inteiro ou numpy.random.Generator; a mesma semente repete a execução.
+    perfil: um perfil.Perfil que recebe contadores e tempo por fase; o resumo
+    também vai em estatisticas["perfil"].
+    """
+    _validar_operadores(selecao, cruzamento)
+    orcamento = Orcamento(tempo_limite, max_avaliacoes)
+    if ng is None and not orcamento.limitado:
+        raise ValueError("ng=None exige tempo_limite ou max_avaliacoes")
+    memetico = _memetico(fracao_memetica, max_avaliacoes_locais)
+    rng = como_gerador(semente)
+    dados = como_problema(dados)
+    avaliar, cache = _criar_avaliador(dados, workers, cache_mb)
+
+    if perfil is not None:
+        relogio = time.perf_counter()
+    estado = _novo_estado(dados, tp, rng)
+    if perfil is not None:
+        perfil.medir("populacao_inicial", relogio)
+    # O pool fica reservado durante a execução inteira: entre uma geração e outra
+    # ele não pode ser encerrado por outra execução que precise de espaço
+    em_paralelo = workers is not None and workers > 1 and tp >= 2 * workers
+    with usar_pool(dados, workers) if em_paralelo else nullcontext():
+        _evoluir(estado, dados, ng, avaliar, tp, tc, tm, ig, selecao, cruzamento, memetico, progresso, orcamento, perfil)
+
+    if perfil is not None:
+        relogio = time.perf_counter()
+    cronograma_final = decodificar_individuo_simples(estado["melhor_individuo"], dados)
+    estatisticas = {"avaliacoes": estado["avaliacoes"], "interrompido": estado.get("interrompido", False)}
+    if memetico is not None:
+        estatisticas["avaliacoes_locais"] = estado.get("avaliacoes_locais", 0)
+    if cache is not None:
+        estatisticas.update(cache.estatisticas())
+    if perfil is not None:
+        perfil.medir("decodificacao_final", relogio)
+        perfil.contar("avaliacoes", estado["avaliacoes"])
+        # Com cache, só as falhas chegam a ser decodificadas
+        perfil.contar("decodificacoes", (cache.falhas if cache is not None else estado["avaliacoes"]) + 1)
+        if cache is not None:
+            perfil.contar("cache_acertos", cache.acertos)
+            perfil.contar("cache_falhas", cache.falhas)
+        if memetico is not None:
+            perfil.contar("avaliacoes_locais", estatisticas["avaliacoes_locais"])
+        estatisticas["perfil"] = perfil.como_dict()
+    return cronograma_final, estado["melhor_makespan"], estado["historico"], estatisticas
@@ -0,0 +1,329 @@
+import heapq
+import math
+import numpy as np
+
+INVIAVEL = math.inf
+
+
+def _arcos_maquina(problema, sequencia):
+    """Predecessor e sucessor de máquina de cada operação (-1 = nenhum), em listas"""
+    n = problema.total_ops
+    ops = sequencia.ops.astype(np.int64)
+    inicio = np.asarray(sequencia.inicio)
+    tem_pred = np.ones(n, dtype=bool)
+    tem_pred[inicio[:-1][np.diff(inicio) > 0]] = False
+    k = np.flatnonzero(tem_pred)
+    pm = np.full(n, -1, dtype=np.int64)
+    sm = np.full(n, -1, dtype=np.int64)
+    pm[ops[k]] = ops[k - 1]
+    sm[ops[k - 1]] = ops[k]
+    return pm.tolist(), sm.tolist()
+
+def _ordem_topologica(pj, sj, pm, sm):
+    """Ordem topológica do grafo disjuntivo (Kahn, linear); None se houver ciclo"""
+    n = len(pj)
+    grau = [(pj[o] >= 0) + (pm[o] >= 0) for o in range(n)]
+    ordem = [o for o in range(n) if grau[o] == 0]
+    # A lista cresce enquanto é percorrida
+    for o in ordem:
+        for s in (sj[o], sm[o]):
+            if s >= 0:
+                grau[s] -= 1
+                if grau[s] == 0:
+                    ordem.append(s)
+    return ordem if len(ordem) == n else None
+
+def _cabecas(ordem, pj, pm, dur):
+    cabeca = [0] * len(ordem)
+    for o in ordem:
+        p, q = pj[o], pm[o]
+        cabeca[o] = max(cabeca[p] + dur[p] if p >= 0 else 0, cabeca[q] + dur[q] if q >= 0 else 0)
+    return cabeca
+
+def _cronograma_por_cabecas(problema, sequencia, cabeca):
+    """Cronograma detalhado a partir das cabeças, na ordem de cada máquina"""
+    dur = problema.lista_duracao
+    cronograma = []
+    for maquina, ops in enumerate(sequencia.listas()):
+        for op in ops:
+            job_id, op_index = divmod(op, problema.n_ops)
+            inicio = cabeca[op]
+            cronograma.append({
+                "Job": f"J{job_id+1}",
+                "Operação": f"Op{op_index+1}",
+                "Máquina": problema.maquinas[maquina],
+                "Início": inicio,
+                "Fim": inicio + dur[op]
+            })
+    return cronograma
+
+def reparar_sequencia(problema, sequencia):
+    """
+    Torna a sequência acíclica, no lugar. Simula a execução das máquinas e, a
+    cada impasse, antecipa na sua máquina a operação liberada pelo job que está
+    mais perto da frente. Retorna quantas operações foram movidas.
+    """
+    n_ops = problema.n_ops
+    maquinas = problema.lista_maquina
+    listas = sequencia.listas()
+    posicao = {}
+    for ops in listas:
+        for k, op in enumerate(ops):
+            posicao[op] = k
+    ponteiro = [0] * len(listas)
+    proxima = [j * n_ops for j in range(problema.n_jobs)]
+    feitos = 0
+    movidos = 0
+    fila = list(range(len(listas)))
+
+    while True:
+        while fila:
+            m = fila.pop()
+            ops = listas[m]
+            while ponteiro[m] < len(ops):
+                op = ops[ponteiro[m]]
+                j = op // n_ops
+                if proxima[j] != op:
+                    break
+                ponteiro[m] += 1
+                proxima[j] += 1
+                feitos += 1
+                if proxima[j] < (j + 1) * n_ops:
+                    fila.append(maquinas[proxima[j]])
+        if feitos == problema.total_ops:
+            break
+
+        # Impasse: antecipa a operação liberada com menor deslocamento
+        op = min(
+            (proxima[j] for j in range(problema.n_jobs) if proxima[j] < (j + 1) * n_ops),
+            key=lambda o: posicao[o] - ponteiro[maquinas[o]],
+        )
+        m = maquinas[op]
+        ops = listas[m]
+        de, para = posicao[op], ponteiro[m]
+        ops[para + 1:de + 1] = ops[para:de]
+        ops[para] = op
+        for k in range(para, de + 1):
+            posicao[ops[k]] = k
+        movidos += 1
+        fila.append(m)
+
+    if movidos:
+        sequencia.ops[:] = [op for ops in listas for op in ops]
+    return movidos
+
+def decodificar_sequencia(problema, sequencia, makespan_only=False, reparar=True):
+    """
+    Cronograma semi-ativo das sequências de máquina: caminho mais longo do grafo
+    disjuntivo em ordem topológica, respeitando a precedência dos jobs.
+    Sequências com ciclo são reparadas no lugar (reparar=True) ou resultam em INVIAVEL.
+    """
+    pj, sj, dur = problema.lista_pred_job, problema.lista_suc_job, problema.lista_duracao
+    pm, sm = _arcos_maquina(problema, sequencia)
+    ordem = _ordem_topologica(pj, sj, pm, sm)
+    if ordem is None:
+        if not reparar:
+            return INVIAVEL
+        reparar_sequencia(problema, sequencia)
+        pm, sm = _arcos_maquina(problema, sequencia)
+        ordem = _ordem_topologica(pj, sj, pm, sm)
+
+    cabeca = _cabecas(ordem, pj, pm, dur)
+    if makespan_only:
+        return max((cabeca[o] + dur[o] for o in problema.ultimas_ops), default=0)
+    return _cronograma_por_cabecas(problema, sequencia, cabeca)
+
+
+class AvaliadorIncremental:
+    """
+    Cabeças (início mais cedo) e caudas (tempo restante após o fim) de cada
+    operação no grafo disjuntivo de uma SequenciaMaquinas.
+
+    Depois de uma troca só a região da ordem topológica entre os arcos
+    invertidos é reordenada, e as cabeças/caudas são propagadas apenas para as
+    operações afetadas. `estimativa` dá um limite inferior O(1) do makespan
+    após a troca, para descartar movimentos ruins sem avaliá-los.
+    """
+
+    def __init__(self, problema, sequencia):
+        self.problema = problema
+        self.sequencia = sequencia
+        self.dur = problema.lista_duracao
+        self.pj = problema.lista_pred_job
+        self.sj = problema.lista_suc_job
+        self.ultimas = problema.ultimas_ops
+        self._diario = []
+        self._movimento = None
+        self._makespan_anterior = None
+        self.recalcular()
+
+    def recalcular(self):
+        """Reconstrói arcos, ordem topológica, cabeças e caudas; retorna o makespan (INVIAVEL se houver ciclo)"""
+        pj, sj, dur = self.pj, self.sj, self.dur
+        self.pm, self.sm = pm, sm = _arcos_maquina(self.problema, self.sequencia)
+        ordem = _ordem_topologica(pj, sj, pm, sm)
+        self._diario = []
+        self._movimento = None
+        if ordem is None:
+            self.ordem = self.pos = self.cabeca = self.cauda = None
+            self.makespan = INVIAVEL
+            return self.makespan
+
+        pos = [0] * len(ordem)
+        for k, o in enumerate(ordem):
+            pos[o] = k
+        cabeca = _cabecas(ordem, pj, pm, dur)
+        cauda = [0] * len(ordem)
+        for o in reversed(ordem):
+            s, t = sj[o], sm[o]
+            cauda[o] = max(cauda[s] + dur[s] if s >= 0 else 0, cauda[t] + dur[t] if t >= 0 else 0)
+
+        self.ordem, self.pos, self.cabeca, self.cauda = ordem, pos, cabeca, cauda
+        self.makespan = max((cabeca[o] + dur[o] for o in self.ultimas), default=0)
+        return self.makespan
+
+    def estimativa(self, movimento):
+        """
+        Limite inferior do makespan após o movimento: comprimento do caminho
+        que passa pelo trecho da máquina entre as posições alteradas.
+        """
+        i, j = movimento.trecho()
+        if i == j or self.makespan is INVIAVEL:
+            return self.makespan
+        base = self.sequencia.inicio[movimento.maquina]
+        fim_maquina = self.sequencia.inicio[movimento.maquina + 1]
+        primeiro, ultimo = movimento.extremos(self.sequencia)
+        x = int(self.sequencia.ops[base + i - 1]) if i > 0 else -1
+        w = int(self.sequencia.ops[base + j + 1]) if base + j + 1 < fim_maquina else -1
+        cabeca, cauda, dur = self.cabeca, self.cauda, self.dur
+
+        p = self.pj[primeiro]
+        cabeca_primeiro = max(cabeca[p] + dur[p] if p >= 0 else 0, cabeca[x] + dur[x] if x >= 0 else 0)
+        s = self.sj[ultimo]
+        cauda_ultimo = max(cauda[s] + dur[s] if s >= 0 else 0, cauda[w] + dur[w] if w >= 0 else 0)
+        trecho = self.sequencia.ops[base + i:base + j + 1].tolist()
+        return cabeca_primeiro + sum(dur[o] for o in trecho) + cauda_ultimo
+
+    def aplicar(self, movimento):
+        """Aplica o movimento na sequência e atualiza o grafo; com ciclo, desfaz sozinho e retorna INVIAVEL"""
+        self._diario = []
+        self._movimento = None
+        i, j = movimento.trecho()
+        if i == j or self.makespan is INVIAVEL:
+            return self.makespan
+
+        movimento.aplicar(self.sequencia)
+        self._movimento = movimento
+        self._makespan_anterior = self.makespan
+
+        base = self.sequencia.inicio[movimento.maquina]
+        fim_maquina = self.sequencia.inicio[movimento.maquina + 1]
+        ops = self.sequencia.ops
+
+        # Arcos de máquina que podem ter mudado: chegam nas posições i, i+1, j, j+1
+        alvos, fontes, arcos = [], [], []
+        for k in sorted({i, i + 1, j, j + 1}):
+            if k >= fim_maquina - base:
+                continue
+            v = int(ops[base + k])
+            u = int(ops[base + k - 1]) if k > 0 else -1
+            self._gravar(self.pm, v, u)
+            alvos.append(v)
+            if u >= 0:
+                self._gravar(self.sm, u, v)
+                fontes.append(u)
+                arcos.append((u, v))
+        ultima = int(ops[fim_maquina - 1])
+        if j == fim_maquina - base - 1:
+            self._gravar(self.sm, ultima, -1)
+            fontes.append(ultima)
+
+        # Reordena só a região da ordem topológica coberta pelos arcos invertidos
+        invertidos = [(u, v) for u, v in arcos if self.pos[u] > self.pos[v]]
+        if invertidos:
+            lb = min(self.pos[v] for _, v in invertidos)
+            ub = max(self.pos[u] for u, _ in invertidos)
+            if not self._reordenar(lb, ub):
+                self.desfazer()
+                return INVIAVEL
+
+        self._propagar_cabecas(alvos)
+        self._propagar_caudas(fontes)
+        dur, cabeca = self.dur, self.cabeca
+        self.makespan = max((cabeca[o] + dur[o] for o in self.ultimas), default=0)
+        return self.makespan
+
+    def desfazer(self):
+        """Desfaz o último `aplicar` (sem efeito se ele foi inviável ou nulo)"""
+        if self._movimento is None:
+            return
+        for lista, indice, valor in reversed(self._diario):
+            lista[indice] = valor
+        self._movimento.desfazer(self.sequencia)
+        self.makespan = self._makespan_anterior
+        self._diario = []
+        self._movimento = None
+
+    def cronograma(self):
+        """Cronograma detalhado a partir das cabeças, na ordem de cada máquina"""
+        return _cronograma_por_cabecas(self.problema, self.sequencia, self.cabeca)
+
+    def _gravar(self, lista, indice, valor):
+        if lista[indice] != valor:
+            self._diario.append((lista, indice, lista[indice]))
+            lista[indice] = valor
+
+    def _reordenar(self, lb, ub):
+        """Kahn restrito às posições lb..ub da ordem; False se houver ciclo"""
+        pos, pj, pm, sj, sm = self.pos, self.pj, self.pm, self.sj, self.sm
+        regiao = self.ordem[lb:ub + 1]
+        grau = {}
+        for o in regiao:
+            grau[o] = sum(1 for p in (pj[o], pm[o]) if p >= 0 and lb <= pos[p] <= ub)
+        fila = [o for o in regiao if grau[o] == 0]
+        for o in fila:
+            for s in (sj[o], sm[o]):
+                if s >= 0 and lb <= pos[s] <= ub:
+                    grau[s] -= 1
+                    if grau[s] == 0:
+                        fila.append(s)
+        if len(fila) < len(regiao):
+            return False
+        for k, o in enumerate(fila, start=lb):
+            self._gravar(self.ordem, k, o)
+            self._gravar(pos, o, k)
+        return True
+
+    def _propagar_cabecas(self, alvos):
+        pos, pj, pm, sj, sm, dur, cabeca = self.pos, self.pj, self.pm, self.sj, self.sm, self.dur, self.cabeca
+        heap = [(pos[o], o) for o in alvos]
+        heapq.heapify(heap)
+        na_fila = set(alvos)
+        while heap:
+            _, o = heapq.heappop(heap)
+            na_fila.discard(o)
+            p, q = pj[o], pm[o]
+            nova = max(cabeca[p] + dur[p] if p >= 0 else 0, cabeca[q] + dur[q] if q >= 0 else 0)
+            if nova != cabeca[o]:
+                self._gravar(cabeca, o, nova)
+                for s in (sj[o], sm[o]):
+                    if s >= 0 and s not in na_fila:
+                        na_fila.add(s)
+                        heapq.heappush(heap, (pos[s], s))
+
+    def _propagar_caudas(self, fontes):
+        pos, pj, pm, sj, sm, dur, cauda = self.pos, self.pj, self.pm, self.sj, self.sm, self.dur, self.cauda
+        heap = [(-pos[o], o) for o in fontes]
+        heapq.heapify(heap)
+        na_fila = set(fontes)
+        while heap:
+            _, o = heapq.heappop(heap)
+            na_fila.discard(o)
+            s, t = sj[o], sm[o]
+            nova = max(cauda[s] + dur[s] if s >= 0 else 0, cauda[t] + dur[t] if t >= 0 else 0)
+            if nova != cauda[o]:
+                self._gravar(cauda, o, nova)
+                for p in (pj[o], pm[o]):
+                    if p >= 0 and p not in na_fila:
+                        na_fila.add(p)
+                        heapq.heappush(heap, (-pos[p], p))
@@ -0,0 +1,163 @@
+import os
+from contextlib import nullcontext
+import numpy as np
+from . import paralelo
+from .problema import como_problema
+from .cronograma import decodificar_individuo_simples
+from .genetico import (_validar_operadores, _memetico, _criar_avaliador, _novo_estado, _evoluir,
+                       _avaliar_populacao_inicial)
+from .orcamento import Orcamento
+from .aleatorio import como_gerador
+
+TOPOLOGIAS = ("anel", "completa")
+
+# Caches de aptidão do lado do worker, um por ilha da execução corrente
+_caches_worker = {}
+
+
+def _evoluir_ilha(estado, problema, caches):
+    # Uma época (intervalo entre migrações) de uma ilha; a avaliação dentro da
+    # ilha é serial, o paralelismo está entre as ilhas
+    p = estado["parametros"]
+    chave = estado["ilha"]
+    if chave not in caches:
+        caches[chave] = _criar_avaliador(problema, None, p["cache_mb"])
+    avaliar, cache = caches[chave]
+    # A ilha pode cair em outro worker na próxima época: acumula só a diferença
+    antes = (cache.acertos, cache.falhas) if cache is not None else (0, 0)
+    _evoluir(estado, problema, estado["geracoes"], avaliar, p["tp"], p["tc"], p["tm"], p["ig"],
+             p["selecao"], p["cruzamento"], p["memetico"], orcamento=Orcamento(*estado["orcamento"]))
+    if cache is not None:
+        estado["cache_acertos"] += cache.acertos - antes[0]
+        estado["cache_falhas"] += cache.falhas - antes[1]
+    return estado
+
+def _evoluir_ilha_worker(estado):
+    global _caches_worker
+    if _caches_worker.get("execucao") != estado["execucao"]:
+        _caches_worker = {"execucao": estado["execucao"]}
+    return _evoluir_ilha(estado, paralelo._problema_worker, _caches_worker)
+
+def _migrar(estados, n_migrantes, topologia):
+    """Os n_migrantes melhores de cada ilha substituem os piores dos vizinhos"""
+    n = len(estados)
+    saindo = []
+    for estado in estados:
+        melhores = np.argsort(estado["makespans"], kind="stable")[:n_migrantes]
+        saindo.append((estado["pop"][melhores].copy(), estado["makespans"][melhores].copy()))
+
+    for i, estado in enumerate(estados):
+        if topologia == "anel":
+            origens = [(i - 1) % n]
+        else:
+            origens = [j for j in range(n) if j != i]
+        pop_in = np.concatenate([saindo[j][0] for j in origens])
+        mk_in = np.concatenate([saindo[j][1] for j in origens])
+        # Nunca substitui a ilha inteira: fica ao menos metade da população local
+        vagas = min(len(mk_in), len(estado["makespans"]) // 2)
+        if vagas == 0:
+            continue
+        escolhidos = np.argsort(mk_in, kind="stable")[:vagas]
+        piores = np.argsort(estado["makespans"], kind="stable")[::-1][:vagas]
+        estado["pop"][piores] = pop_in[escolhidos]
+        estado["makespans"][piores] = mk_in[escolhidos]
+
+def algoritmo_genetico_ilhas(dados, n_ilhas=4, tp=30, ng=50, tc=0.8, tm=0.1, ig=0.2,
+                             intervalo_migracao=10, n_migrantes=2, topologia="anel",
+                             workers=None, cache_mb=16, selecao="roleta", cruzamento="jox",
+                             fracao_memetica=0.0, max_avaliacoes_locais=50, progresso=None,
+                             tempo_limite=None, max_avaliacoes=None, semente=None):
+    """
+    Modelo de ilhas: n_ilhas populações de tamanho tp evoluem ng gerações cada uma,
+    em processos separados (workers, padrão = uma por núcleo até n_ilhas), trocando
+    os n_migrantes melhores a cada intervalo_migracao gerações ("anel" ou "completa").
+    Retorna (cronograma, makespan, historico, estatisticas), com historico sendo o
+    melhor global por geração e estatisticas["historicos_ilhas"] o de cada ilha.
+    Os demais parâmetros são os de algoritmo_genetico_simples, valendo por ilha;
+    progresso é chamado com o historico global ao fim de cada intervalo de migração.
+    tempo_limite (s) / max_avaliacoes valem para o conjunto das ilhas (as avaliações
+    restantes são divididas entre elas a cada intervalo); com orçamento, ng pode ser None.
+    """
+    _validar_operadores(selecao, cruzamento)
+    memetico = _memetico(fracao_memetica, max_avaliacoes_locais)
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"topologia deve ser uma de {TOPOLOGIAS}")
+    if n_ilhas < 1 or intervalo_migracao < 1:
+        raise ValueError("n_ilhas e intervalo_migracao devem ser positivos")
+    orcamento = Orcamento(tempo_limite, max_avaliacoes)
+    if ng is None and not orcamento.limitado:
+        raise ValueError("ng=None exige tempo_limite ou max_avaliacoes")
+    problema = como_problema(dados)
+    if workers is None:
+        workers = min(n_ilhas, os.cpu_count() or 1)
+
+    parametros = {"tp": tp, "tc": tc, "tm": tm, "ig": ig, "cache_mb": cache_mb,
+                  "selecao": selecao, "cruzamento": cruzamento, "memetico": memetico}
+    # Identifica os caches dos workers desta execução; não vem da semente para
+    # duas execuções com a mesma semente não compartilharem cache
+    execucao = int.from_bytes(os.urandom(8), "little")
+    estados = []
+    # Cada ilha tem seu próprio gerador, derivado da semente: o resultado não depende de onde roda
+    for ilha, rng in enumerate(como_gerador(semente).spawn(n_ilhas)):
+        estado = _novo_estado(problema, tp, rng)
+        estado.update(ilha=ilha, execucao=execucao, parametros=parametros,
+                      cache_acertos=0, cache_falhas=0)
+        estados.append(estado)
+
+    caches_locais = {}
+    feitas = 0
+    interrompido = False
+    em_paralelo = workers > 1 and n_ilhas > 1
+    # O pool fica reservado durante toda a execução, não só a cada época
+    with paralelo.usar_pool(problema, workers) if em_paralelo else nullcontext() as pool:
+        while (ng is None or feitas < ng) and not interrompido and not orcamento.esgotado():
+            geracoes = intervalo_migracao if ng is None else min(intervalo_migracao, ng - feitas)
+            segundos, avaliacoes = orcamento.restante()
+            if segundos is not None:
+                # Ilhas que rodam em sequência (no mesmo processo) dividem o tempo
+                segundos /= -(-n_ilhas // (workers if em_paralelo else 1))
+            if avaliacoes is not None:
+                avaliacoes = -(-avaliacoes // n_ilhas)
+            avaliacoes_antes = sum(e["avaliacoes"] + e.get("avaliacoes_locais", 0) for e in estados)
+            for estado in estados:
+                estado["geracoes"] = geracoes
+                estado["orcamento"] = (segundos, avaliacoes)
+            if em_paralelo:
+                estados = list(pool.map(_evoluir_ilha_worker, estados))
+            else:
+                estados = [_evoluir_ilha(e, problema, caches_locais) for e in estados]
+            orcamento.contar(sum(e["avaliacoes"] + e.get("avaliacoes_locais", 0) for e in estados) - avaliacoes_antes)
+            feitas = min(len(e["historico"]) for e in estados)
+            if progresso is not None:
+                interrompido = bool(progresso([min(h) for h in zip(*(e["historico"] for e in estados))]))
+            if (ng is None or feitas < ng) and not interrompido and n_ilhas > 1 and n_migrantes > 0:
+                _migrar(estados, n_migrantes, topologia)
+
+    # Orçamento esgotado antes da primeira época: o resultado é a melhor das populações iniciais
+    avaliar_inicial, _ = _criar_avaliador(problema, None, 0)
+    for estado in estados:
+        if estado["makespans"] is None:
+            _avaliar_populacao_inicial(estado, avaliar_inicial, orcamento)
+
+    historicos = [e["historico"] for e in estados]
+    historico = [min(h) for h in zip(*historicos)]
+    melhor = min(estados, key=lambda e: e["melhor_makespan"])
+
+    estatisticas = {
+        "avaliacoes": sum(e["avaliacoes"] for e in estados),
+        "historicos_ilhas": historicos,
+        "interrompido": interrompido,
+    }
+    if memetico is not None:
+        estatisticas["avaliacoes_locais"] = sum(e.get("avaliacoes_locais", 0) for e in estados)
+    if cache_mb and cache_mb > 0:
+        acertos = sum(e["cache_acertos"] for e in estados)
+        falhas = sum(e["cache_falhas"] for e in estados)
+        estatisticas.update(
+            cache_acertos=acertos,
+            cache_falhas=falhas,
+            cache_taxa_acerto=acertos / (acertos + falhas) if acertos + falhas else 0.0,
+        )
+
+    cronograma_final = decodificar_individuo_simples(melhor["melhor_individuo"], problema)
+    return cronograma_final, melhor["melhor_makespan"], historico, estatisticas
@@ -0,0 +1,37 @@
+import time
+
+
+class Orcamento:
+    """
+    Limite de tempo (segundos) e/ou de avaliações de uma busca; None = sem limite.
+    Os solvers chamam contar() a cada avaliação e param quando esgotado().
+    """
+
+    __slots__ = ("prazo", "max_avaliacoes", "avaliacoes")
+
+    def __init__(self, tempo_limite=None, max_avaliacoes=None):
+        if tempo_limite is not None and tempo_limite < 0:
+            raise ValueError("tempo_limite deve ser >= 0")
+        if max_avaliacoes is not None and max_avaliacoes < 0:
+            raise ValueError("max_avaliacoes deve ser >= 0")
+        self.prazo = time.perf_counter() + tempo_limite if tempo_limite is not None else None
+        self.max_avaliacoes = max_avaliacoes
+        self.avaliacoes = 0
+
+    @property
+    def limitado(self):
+        return self.prazo is not None or self.max_avaliacoes is not None
+
+    def contar(self, n=1):
+        self.avaliacoes += n
+
+    def esgotado(self):
+        if self.max_avaliacoes is not None and self.avaliacoes >= self.max_avaliacoes:
+            return True
+        return self.prazo is not None and time.perf_counter() >= self.prazo
+
+    def restante(self):
+        """(segundos, avaliações) que ainda restam, para repassar a outra busca"""
+        segundos = max(0.0, self.prazo - time.perf_counter()) if self.prazo is not None else None
+        avaliacoes = max(0, self.max_avaliacoes - self.avaliacoes) if self.max_avaliacoes is not None else None
+        return segundos, avaliacoes
@@ -0,0 +1,113 @@
+import atexit
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import numpy as np
+from .problema import Problema
+from .cronograma import makespan_populacao
+
+# Pools persistentes (sobrevivem entre gerações e entre reruns do Streamlit), um
+# por (problema, número de processos), do menos ao mais recentemente usado.
+# Execuções simultâneas sobre problemas diferentes (threads do Streamlit) têm
+# cada uma o seu; só pools ociosos são encerrados para abrir espaço.
+MAX_POOLS = 4
+_pools = OrderedDict()  # chave -> [pool, execuções usando]
+_trava_pool = threading.RLock()
+
+# Problema do lado do worker, recebido uma única vez pelo initializer
+_problema_worker = None
+
+
+def _iniciar_worker(rotas, duracoes, maquinas):
+    global _problema_worker
+    _problema_worker = Problema(rotas, duracoes, maquinas)
+
+def _avaliar_bloco(bloco):
+    return makespan_populacao(bloco, _problema_worker)
+
+def _descartar_ociosos(limite):
+    # Encerra os pools ociosos mais antigos até sobrarem `limite`; os que estão em
+    # uso ficam (o total pode passar de MAX_POOLS enquanto durarem as execuções)
+    for chave, (pool, usos) in list(_pools.items()):
+        if len(_pools) <= limite:
+            break
+        if usos == 0:
+            del _pools[chave]
+            pool.shutdown(wait=False)
+
+def encerrar_pool():
+    """Encerra os pools de processos ociosos (os que estão em uso terminam o trabalho)"""
+    with _trava_pool:
+        _descartar_ociosos(0)
+
+atexit.register(encerrar_pool)
+
+@contextmanager
+def usar_pool(problema, workers):
+    """
+    Pool com `workers` processos que já têm o problema carregado, reservado
+    enquanto durar o bloco `with`: nenhuma outra execução o encerra nesse meio-tempo.
+    """
+    chave = (problema.chave(), workers)
+    with _trava_pool:
+        entrada = _pools.pop(chave, None)
+        if entrada is None:
+            # spawn: o Streamlit tem várias threads, e fork com threads pode travar
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_iniciar_worker,
+                initargs=(problema.rotas, problema.duracoes, problema.maquinas),
+            )
+            entrada = [pool, 0]
+        entrada[1] += 1
+        _pools[chave] = entrada
+        _descartar_ociosos(MAX_POOLS)
+    try:
+        yield entrada[0]
+    finally:
+        with _trava_pool:
+            entrada[1] -= 1
+            _descartar_ociosos(MAX_POOLS)
+
+class SinalParada:
+    """
+    Flag de parada compartilhada entre processos, num byte de memória
+    compartilhada. Vai junto com as tarefas do pool (é serializável) e lê-la
+    não passa por IPC, então as buscas podem consultá-la a cada avaliação.
+    Quem criou o sinal o remove em fechar().
+    """
+
+    __slots__ = ("_memoria", "_dono")
+
+    def __init__(self, nome=None):
+        self._dono = nome is None
+        self._memoria = shared_memory.SharedMemory(name=nome, create=self._dono, size=1)
+        if self._dono:
+            self._memoria.buf[0] = 0
+
+    def __reduce__(self):
+        return (SinalParada, (self._memoria.name,))
+
+    def ativar(self):
+        self._memoria.buf[0] = 1
+
+    def ativo(self):
+        return self._memoria.buf[0] == 1
+
+    def fechar(self):
+        self._memoria.close()
+        if self._dono:
+            self._memoria.unlink()
+
+def makespan_populacao_paralelo(pop, problema, workers):
+    """makespan_populacao dividida em blocos entre `workers` processos; mesmo resultado da versão serial"""
+    pop = np.asarray(pop, dtype=np.int32)
+    if workers is None or workers <= 1 or len(pop) < 2 * workers:
+        return makespan_populacao(pop, problema)
+    blocos = np.array_split(pop, workers)
+    with usar_pool(problema, workers) as pool:
+        return np.concatenate(list(pool.map(_avaliar_bloco, blocos)))
@@ -0,0 +1,40 @@
+import json
+import time
+
+
+class Perfil:
+    """
+    Contadores e tempos por fase (s) de uma execução. Os solvers recebem
+    perfil=None por padrão e só cronometram quando há um Perfil: desligado, o
+    custo é um teste por passo e alguns inteiros somados no fim.
+    """
+
+    __slots__ = ("contadores", "tempos")
+
+    def __init__(self):
+        self.contadores = {}
+        self.tempos = {}
+
+    def contar(self, nome, n=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + n
+
+    def medir(self, nome, inicio):
+        """Soma à fase `nome` o tempo desde `inicio` (perf_counter) e devolve o instante atual"""
+        agora = time.perf_counter()
+        self.tempos[nome] = self.tempos.get(nome, 0.0) + agora - inicio
+        return agora
+
+    def como_dict(self):
+        total = sum(self.tempos.values())
+        return {
+            "contadores": dict(self.contadores),
+            "tempos": {nome: round(t, 6) for nome, t in self.tempos.items()},
+            "fracao_tempo": {nome: round(t / total, 4) for nome, t in self.tempos.items()} if total > 0 else {},
+        }
+
+    def para_json(self):
+        return json.dumps(self.como_dict(), ensure_ascii=False, indent=2)
+
+    def salvar(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(self.para_json())
@@ -0,0 +1,141 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from . import paralelo
+from .problema import como_problema
+from .cronograma import cronograma_aleatorio, avalia
+from .aleatorio import como_gerador
+from .orcamento import Orcamento
+from .busca_local import (
+    subida_de_encosta,
+    subida_de_encosta_com_tentativas,
+    tempera_simulada,
+    busca_tabu,
+)
+
+METODOS_LOCAIS = {
+    "subida": subida_de_encosta,
+    "subida_tentativas": subida_de_encosta_com_tentativas,
+    "tempera": tempera_simulada,
+    "tabu": busca_tabu,
+}
+
+
+class _OrcamentoComParada(Orcamento):
+    """Orçamento de um reinício que também se esgota quando outro reinício atinge o alvo"""
+
+    __slots__ = ("sinal",)
+
+    def __init__(self, tempo_limite, max_avaliacoes, sinal):
+        super().__init__(tempo_limite, max_avaliacoes)
+        self.sinal = sinal
+
+    def esgotado(self):
+        return self.sinal.ativo() or Orcamento.esgotado(self)
+
+
+def _executar_reinicio(metodo, reinicio, semente, parametros, alvo, problema, sinal=None):
+    # Um reinício: solução inicial aleatória própria e a busca a partir dela. A
+    # busca para ao atingir o alvo; com `sinal`, avisa os outros reinícios e
+    # também para quando algum deles o atinge
+    rng = como_gerador(semente)
+    inicio = time.perf_counter()
+    solucao_inicial = cronograma_aleatorio(problema, rng)
+    parametros = dict(parametros)
+    if sinal is not None:
+        parametros["orcamento"] = _OrcamentoComParada(parametros.pop("tempo_limite", None),
+                                                      parametros.pop("max_avaliacoes", None), sinal)
+
+    def progresso(historico):
+        if historico[-1] > alvo:
+            return False
+        if sinal is not None:
+            sinal.ativar()
+        return True
+
+    cronograma, makespan = METODOS_LOCAIS[metodo](problema, solucao_inicial, semente=rng, progresso=progresso,
+                                                  **parametros)
+    return {
+        "metodo": metodo,
+        "reinicio": reinicio,
+        "semente": semente,
+        "makespan_inicial": avalia(solucao_inicial),
+        "makespan": makespan,
+        "tempo": time.perf_counter() - inicio,
+        "cronograma": cronograma,
+    }
+
+def _executar_reinicio_worker(tarefa, sinal):
+    try:
+        return _executar_reinicio(*tarefa, paralelo._problema_worker, sinal)
+    finally:
+        sinal.fechar()
+
+def portfolio_multi_inicio(dados, metodos=("subida_tentativas", "tempera", "tabu"), reinicios=4,
+                           parametros=None, workers=None, alvo=None, semente=None):
+    """
+    Executa `reinicios` reinícios independentes de cada método (soluções iniciais
+    aleatórias diferentes) no pool de processos, guardando o melhor global.
+    Para cedo quando algum reinício atinge `alvo` (padrão: o limite inferior do
+    problema, ou seja, um ótimo provado): os reinícios ainda não iniciados são
+    cancelados e os que estão rodando param na próxima avaliação, liberando o
+    pool. O melhor global fica só no processo principal; entre os reinícios em
+    andamento circula apenas esse sinal de parada. parametros: {metodo: kwargs}
+    repassados a cada método.
+    Retorna (cronograma, makespan, execucoes), com uma entrada por reinício executado.
+    Cada reinício recebe uma semente tirada de `semente`, então com a mesma
+    semente o portfólio se repete, em série ou em paralelo.
+    """
+    problema = como_problema(dados)
+    desconhecidos = [m for m in metodos if m not in METODOS_LOCAIS]
+    if desconhecidos:
+        raise ValueError(f"Métodos desconhecidos: {desconhecidos}; use {sorted(METODOS_LOCAIS)}")
+    parametros = parametros or {}
+    if alvo is None:
+        alvo = problema.limite_inferior()
+
+    sementes = iter(como_gerador(semente).integers(0, 2**32, reinicios * len(metodos)).tolist())
+    tarefas = [
+        (metodo, r, next(sementes), parametros.get(metodo, {}), alvo)
+        for r in range(reinicios)
+        for metodo in metodos
+    ]
+
+    execucoes = []
+    melhor = None
+
+    def registrar(execucao):
+        nonlocal melhor
+        execucoes.append(execucao)
+        if melhor is None or execucao["makespan"] < melhor["makespan"]:
+            melhor = execucao
+        return melhor["makespan"] <= alvo
+
+    if workers is None or workers <= 1 or len(tarefas) < 2:
+        for tarefa in tarefas:
+            if registrar(_executar_reinicio(*tarefa, problema)):
+                break
+    else:
+        sinal = paralelo.SinalParada()
+        try:
+            with paralelo.usar_pool(problema, workers) as pool:
+                pendentes = {pool.submit(_executar_reinicio_worker, tarefa, sinal) for tarefa in tarefas}
+                atingiu = False
+                while pendentes:
+                    prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        if not futuro.cancelled():
+                            atingiu = registrar(futuro.result()) or atingiu
+                    if atingiu:
+                        sinal.ativar()
+                    if sinal.ativo():
+                        # Os não iniciados são cancelados; os que estão rodando veem o
+                        # sinal e voltam em seguida com o melhor que tinham
+                        for futuro in pendentes:
+                            futuro.cancel()
+        finally:
+            sinal.fechar()
+
+    execucoes.sort(key=lambda e: (e["reinicio"], metodos.index(e["metodo"])))
+    if melhor is None:
+        return [], float('inf'), execucoes
+    return melhor["cronograma"], melhor["makespan"], execucoes
@@ -0,0 +1,115 @@
+import hashlib
+import numpy as np
+from .aleatorio import como_gerador
+
+
+class Problema:
+    """
+    Instância de job shop em arrays NumPy contíguos.
+
+    `rotas[j, k]` é o id da máquina da operação k do job j e `duracoes[j, k]`
+    sua duração. As operações também são numeradas de forma plana
+    (op = j * n_ops + k), que é o índice usado pelos decodificadores.
+    """
+
+    def __init__(self, rotas, duracoes, maquinas=None):
+        rotas = np.ascontiguousarray(rotas, dtype=np.int32)
+        duracoes = np.ascontiguousarray(duracoes, dtype=np.int32)
+        if rotas.ndim != 2 or rotas.shape != duracoes.shape:
+            raise ValueError("Rotas e durações devem ser matrizes jobs × operações do mesmo formato")
+
+        self.rotas = rotas
+        self.duracoes = duracoes
+        self.n_jobs, self.n_ops = rotas.shape
+        self.total_ops = self.n_jobs * self.n_ops
+
+        if maquinas is None:
+            n_maquinas = int(rotas.max()) + 1 if rotas.size else 0
+            maquinas = [f"M{m+1}" for m in range(n_maquinas)]
+        self.maquinas = list(maquinas)
+        self.n_maquinas = len(self.maquinas)
+        if rotas.size and (rotas.min() < 0 or rotas.max() >= self.n_maquinas):
+            raise ValueError("Rota referencia uma máquina inexistente")
+
+        # Vetores planos indexados pela operação
+        self.maquina_op = self.rotas.ravel()
+        self.duracao_op = self.duracoes.ravel()
+        self.job_op = np.repeat(np.arange(self.n_jobs, dtype=np.int32), self.n_ops)
+
+        # Operações de cada máquina, em ordem de job, concatenadas num único vetor;
+        # as da máquina m ficam em ops_maquinas[inicio_maquina[m]:inicio_maquina[m+1]]
+        self.ops_maquinas = np.argsort(self.maquina_op, kind="stable").astype(np.int32)
+        contagem = np.bincount(self.maquina_op, minlength=self.n_maquinas)
+        self.inicio_maquina = np.concatenate(([0], np.cumsum(contagem))).astype(np.int32)
+        self.ops_por_maquina = np.split(self.ops_maquinas, self.inicio_maquina[1:-1])
+
+        # Cópias em listas para os laços escalares (indexar ndarray elemento a elemento é lento)
+        self.lista_maquina = self.maquina_op.tolist()
+        self.lista_duracao = self.duracao_op.tolist()
+        # Predecessor/sucessor no job de cada operação (-1 = nenhum)
+        self.lista_pred_job = [o - 1 if o % self.n_ops else -1 for o in range(self.total_ops)]
+        self.lista_suc_job = [o + 1 if (o + 1) % self.n_ops else -1 for o in range(self.total_ops)]
+        self.ultimas_ops = [(j + 1) * self.n_ops - 1 for j in range(self.n_jobs)] if self.n_ops else []
+
+    @classmethod
+    def de_dados(cls, dados):
+        """Converte a lista de jobs [(máquina, duração), ...] em Problema"""
+        if not dados:
+            raise ValueError("O problema precisa ter pelo menos um job")
+        n_ops = len(dados[0])
+        if any(len(job) != n_ops for job in dados):
+            raise ValueError("Todos os jobs devem ter o mesmo número de operações")
+
+        # Máquinas numeradas pela ordem em que aparecem
+        ids = {}
+        for job in dados:
+            for maquina, _ in job:
+                if maquina not in ids:
+                    ids[maquina] = len(ids)
+
+        rotas = [[ids[maquina] for maquina, _ in job] for job in dados]
+        duracoes = [[duracao for _, duracao in job] for job in dados]
+        return cls(rotas, duracoes, maquinas=list(ids))
+
+    def chave(self):
+        """Hash do conteúdo do problema (rotas, durações e nomes das máquinas)"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.asarray(self.rotas.shape, dtype=np.int64).tobytes())
+        h.update(self.rotas.tobytes())
+        h.update(self.duracoes.tobytes())
+        h.update("\x00".join(self.maquinas).encode())
+        return h.hexdigest()
+
+    def limite_inferior(self):
+        """Limite inferior simples do makespan: maior duração de job ou carga de máquina"""
+        if not self.total_ops:
+            return 0
+        carga = np.bincount(self.maquina_op, weights=self.duracao_op, minlength=self.n_maquinas)
+        return int(max(self.duracoes.sum(axis=1).max(), carga.max()))
+
+    def para_dados(self):
+        """Retorna o problema no formato de lista de jobs [(máquina, duração), ...]"""
+        return [
+            [(self.maquinas[m], d) for m, d in zip(rota, duracao)]
+            for rota, duracao in zip(self.rotas.tolist(), self.duracoes.tolist())
+        ]
+
+
+def como_problema(dados):
+    """Aceita um Problema ou a lista de jobs e retorna sempre um Problema"""
+    if isinstance(dados, Problema):
+        return dados
+    return Problema.de_dados(dados)
+
+
+def gerar_problema_aleatorio(num_jobs, num_maquinas, semente=None):
+    """Cada job visita todas as máquinas em ordem aleatória, com durações de 1 a 10"""
+    rng = como_gerador(semente)
+    maquinas = [f"M{i+1}" for i in range(num_maquinas)]
+    rotas = rng.permuted(np.tile(np.arange(num_maquinas), (num_jobs, 1)), axis=1)
+    duracoes = rng.integers(1, 11, size=(num_jobs, num_maquinas))
+
+    return [
+        [(maquinas[m], d) for m, d in zip(rota, duracao)]
+        for rota, duracao in zip(rotas.tolist(), duracoes.tolist())
+    ]
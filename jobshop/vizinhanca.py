@@ -0,0 +1,192 @@
+import numpy as np
+
+
+class SequenciaMaquinas:
+    """
+    Sequência de operações de todas as máquinas num único vetor de permutação.
+    A máquina m ocupa ops[inicio[m]:inicio[m+1]]; os movimentos alteram `ops`
+    no lugar, sem copiar a solução.
+    """
+
+    __slots__ = ("ops", "inicio")
+
+    def __init__(self, ops, inicio):
+        self.ops = ops
+        self.inicio = inicio
+
+    @classmethod
+    def do_problema(cls, problema):
+        """Sequência inicial: operações de cada máquina na ordem dos jobs"""
+        return cls(problema.ops_maquinas.copy(), problema.inicio_maquina.tolist())
+
+    @classmethod
+    def de_listas(cls, listas):
+        """Sequência a partir de uma lista de operações por máquina"""
+        inicio = [0]
+        for ops in listas:
+            inicio.append(inicio[-1] + len(ops))
+        ops = np.fromiter((op for lista in listas for op in lista), dtype=np.int32, count=inicio[-1])
+        return cls(ops, inicio)
+
+    def __len__(self):
+        return len(self.inicio) - 1
+
+    def tamanho(self, maquina):
+        return self.inicio[maquina + 1] - self.inicio[maquina]
+
+    def maquina(self, maquina):
+        """Visão (sem cópia) da sequência de uma máquina"""
+        return self.ops[self.inicio[maquina]:self.inicio[maquina + 1]]
+
+    def listas(self):
+        """Sequências como listas de listas, para os laços escalares dos decodificadores"""
+        ops = self.ops.tolist()
+        return [ops[a:b] for a, b in zip(self.inicio, self.inicio[1:])]
+
+    def copy(self):
+        return SequenciaMaquinas(self.ops.copy(), self.inicio)
+
+
+class Troca:
+    """Troca das posições i e j da sequência de uma máquina; desfazer é aplicar de novo"""
+
+    __slots__ = ("maquina", "i", "j")
+
+    def __init__(self, maquina, i, j):
+        self.maquina = maquina
+        self.i = i
+        self.j = j
+
+    def __repr__(self):
+        return f"Troca(maquina={self.maquina}, i={self.i}, j={self.j})"
+
+    def trecho(self):
+        """Primeira e última posição alteradas na máquina"""
+        return min(self.i, self.j), max(self.i, self.j)
+
+    def extremos(self, sequencia):
+        """Operações que vão ocupar a primeira e a última posição do trecho"""
+        i, j = self.trecho()
+        base = sequencia.inicio[self.maquina]
+        return int(sequencia.ops[base + j]), int(sequencia.ops[base + i])
+
+    def aplicar(self, sequencia):
+        base = sequencia.inicio[self.maquina]
+        a, b = base + self.i, base + self.j
+        ops = sequencia.ops
+        ops[a], ops[b] = ops[b], ops[a]
+
+    desfazer = aplicar
+
+
+class Insercao:
+    """Retira a operação da posição `de` e a reinsere na posição `para` da mesma máquina"""
+
+    __slots__ = ("maquina", "de", "para")
+
+    def __init__(self, maquina, de, para):
+        self.maquina = maquina
+        self.de = de
+        self.para = para
+
+    def __repr__(self):
+        return f"Insercao(maquina={self.maquina}, de={self.de}, para={self.para})"
+
+    def trecho(self):
+        return min(self.de, self.para), max(self.de, self.para)
+
+    def extremos(self, sequencia):
+        base = sequencia.inicio[self.maquina]
+        ops = sequencia.ops
+        if self.de < self.para:
+            return int(ops[base + self.de + 1]), int(ops[base + self.de])
+        return int(ops[base + self.de]), int(ops[base + self.de - 1])
+
+    def aplicar(self, sequencia):
+        self._mover(sequencia, self.de, self.para)
+
+    def desfazer(self, sequencia):
+        self._mover(sequencia, self.para, self.de)
+
+    def _mover(self, sequencia, de, para):
+        base = sequencia.inicio[self.maquina]
+        ops = sequencia.ops
+        a, b = base + de, base + para
+        op = ops[a]
+        if a < b:
+            ops[a:b] = ops[a + 1:b + 1]
+        else:
+            ops[b + 1:a + 1] = ops[b:a]
+        ops[b] = op
+
+
+VIZINHANCAS = ("aleatoria", "n5", "n7")
+
+
+def caminho_critico(avaliador):
+    """
+    Um caminho crítico do grafo (da primeira à última operação), a partir das
+    cabeças do AvaliadorIncremental. Prefere o arco de máquina para formar blocos.
+    """
+    cabeca, dur, pj, pm = avaliador.cabeca, avaliador.dur, avaliador.pj, avaliador.pm
+    makespan = avaliador.makespan
+    o = next((u for u in avaliador.ultimas if cabeca[u] + dur[u] == makespan), -1)
+    caminho = []
+    while o >= 0:
+        caminho.append(o)
+        p, q = pm[o], pj[o]
+        if p >= 0 and cabeca[p] + dur[p] == cabeca[o]:
+            o = p
+        elif q >= 0 and cabeca[q] + dur[q] == cabeca[o]:
+            o = q
+        else:
+            o = -1
+    caminho.reverse()
+    return caminho
+
+def blocos_criticos(avaliador):
+    """Blocos do caminho crítico: (máquina, posição da 1ª operação, tamanho), em ordem"""
+    maquinas = avaliador.problema.lista_maquina
+    blocos = []
+    anterior = -1
+    for o in caminho_critico(avaliador):
+        if anterior >= 0 and avaliador.pm[o] == anterior:
+            m, inicio, tamanho = blocos[-1]
+            blocos[-1] = (m, inicio, tamanho + 1)
+        else:
+            m = maquinas[o]
+            posicao = int(np.flatnonzero(avaliador.sequencia.maquina(m) == o)[0])
+            blocos.append((m, posicao, 1))
+        anterior = o
+    return blocos
+
+def vizinhanca_critica(avaliador, tipo="n5"):
+    """
+    Movimentos das vizinhanças de caminho crítico.
+    n5: troca as duas primeiras e as duas últimas operações de cada bloco
+    (exceto o início do primeiro bloco e o fim do último).
+    n7: n5 mais levar operações internas ao início/fim do bloco e as
+    extremidades para o interior.
+    """
+    if tipo not in ("n5", "n7"):
+        raise ValueError(f"Vizinhança crítica desconhecida: {tipo}")
+    blocos = blocos_criticos(avaliador)
+    movimentos = []
+    for b, (m, inicio, tamanho) in enumerate(blocos):
+        if tamanho < 2:
+            continue
+        fim = inicio + tamanho - 1
+        if b > 0:
+            movimentos.append(Troca(m, inicio, inicio + 1))
+        if b < len(blocos) - 1 and (tamanho > 2 or b == 0):
+            movimentos.append(Troca(m, fim - 1, fim))
+        if tipo == "n7" and tamanho > 2:
+            # Inserções vizinhas às extremidades seriam as próprias trocas do n5
+            for k in range(inicio + 1, fim):
+                if k > inicio + 1:
+                    movimentos.append(Insercao(m, k, inicio))
+                    movimentos.append(Insercao(m, inicio, k))
+                if k < fim - 1:
+                    movimentos.append(Insercao(m, k, fim))
+                    movimentos.append(Insercao(m, fim, k))
+    return movimentos
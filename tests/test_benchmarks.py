@@ -0,0 +1,112 @@
+import io
+import numpy as np
+import pytest
+from jobshop.arquivos import ler_instancia
+from jobshop.benchmarks import detectar_formato, ler_benchmark, ler_orlib, ler_taillard
+
+ORLIB_VARIAS = """\
+ +++++++++++++++++++++++++++++
+
+ instance mini1
+
+ +++++++++++++++++++++++++++++
+ Instância 2x2 de teste
+ 2 2
+ 0 3 1 2
+ 1 4 0 1
+ +++++++++++++++++++++++++++++
+
+ instance mini2
+
+ +++++++++++++++++++++++++++++
+ Instância 3x2 de teste, com um job
+ quebrado em duas linhas
+ 3 2
+ 1 5 0 2
+ 0 1
+ 1 1
+ 0 2 1 7
+ +++++++++++++++++++++++++++++
+ EOF
+ +++++++++++++++++++++++++++++
+"""
+
+
+def _taillard(n_jobs, n_maquinas, n_instancias, semente=0):
+    # Texto de um lote de Taillard; o limite superior do cabeçalho é 1000 + índice
+    rng = np.random.default_rng(semente)
+    partes = []
+    for k in range(n_instancias):
+        tempos = rng.integers(1, 100, (n_jobs, n_maquinas))
+        maquinas = rng.permuted(np.tile(np.arange(1, n_maquinas + 1), (n_jobs, 1)), axis=1)
+        partes.append("Nb of jobs, Nb of Machines, Time seed, Machine seed, Upper bound, Lower bound\n")
+        partes.append(f"{n_jobs} {n_maquinas} 123 456 {1000 + k} 900\n")
+        partes.append("Times\n" + "".join(" ".join(map(str, t)) + "\n" for t in tempos))
+        partes.append("Machines\n" + "".join(" ".join(map(str, m)) + "\n" for m in maquinas))
+    return "".join(partes)
+
+def _gravar(pasta, nome, texto):
+    caminho = pasta / nome
+    caminho.write_text(texto, encoding="utf-8")
+    return str(caminho)
+
+
+def test_orlib_com_varias_instancias():
+    instancias = list(ler_orlib(io.StringIO(ORLIB_VARIAS)))
+    assert [i.nome for i in instancias] == ["mini1", "mini2"]
+    mini1, mini2 = (i.problema for i in instancias)
+    assert mini1.rotas.tolist() == [[0, 1], [1, 0]]
+    assert mini1.duracoes.tolist() == [[3, 2], [4, 1]]
+    assert mini2.rotas.tolist() == [[1, 0], [0, 1], [0, 1]]
+    assert mini2.duracoes.tolist() == [[5, 2], [1, 1], [2, 7]]
+    assert all(i.melhor_conhecido is None for i in instancias)
+
+def test_orlib_nome_conhecido_traz_o_melhor():
+    texto = " instance ft06\n 2 2\n 0 3 1 2\n 1 4 0 1\n"
+    (instancia,) = ler_orlib(io.StringIO(texto))
+    assert instancia.nome == "ft06" and instancia.melhor_conhecido == 55
+
+def test_escolha_por_nome(tmp_path):
+    caminho = _gravar(tmp_path, "jobshop1.txt", ORLIB_VARIAS)
+    assert detectar_formato(caminho) == "orlib"
+    assert ler_instancia(caminho, nome="MINI2").n_jobs == 3
+    assert ler_instancia(caminho).n_jobs == 2
+    with pytest.raises(ValueError, match="não encontrada"):
+        ler_instancia(caminho, nome="mini3")
+
+def test_taillard_lote_recebe_nomes_e_melhores(tmp_path):
+    caminho = _gravar(tmp_path, "tai15_15.txt", _taillard(15, 15, 3))
+    assert detectar_formato(caminho) == "taillard"
+    instancias = list(ler_benchmark(caminho))
+    assert [i.nome for i in instancias] == ["ta01", "ta02", "ta03"]
+    assert [i.melhor_conhecido for i in instancias] == [1231, 1244, 1218]
+    assert [i.limite_superior for i in instancias] == [1000, 1001, 1002]
+    # Máquinas do arquivo começam em 1
+    assert all(sorted(rota) == list(range(15)) for rota in instancias[0].problema.rotas.tolist())
+    assert ler_instancia(caminho, nome="ta02").chave() == instancias[1].problema.chave()
+
+def test_taillard_sem_melhor_conhecido_guarda_so_o_limite(tmp_path):
+    # ta41–ta50 não têm ótimo provado: o limite do cabeçalho não vira melhor_conhecido
+    caminho = _gravar(tmp_path, "tai30_20.txt", _taillard(30, 20, 2))
+    instancias = list(ler_taillard(caminho))
+    assert [i.nome for i in instancias] == ["ta41", "ta42"]
+    assert [i.melhor_conhecido for i in instancias] == [None, None]
+    assert [i.limite_superior for i in instancias] == [1000, 1001]
+
+def test_taillard_avulso(tmp_path):
+    caminho = _gravar(tmp_path, "minha.txt", _taillard(3, 2, 2))
+    assert [i.nome for i in ler_taillard(caminho)] == ["minha", "minha_2"]
+
+@pytest.mark.parametrize("corte", ["Machines", "Times"])
+def test_taillard_truncado(corte):
+    texto = _taillard(3, 2, 1)
+    texto = texto[:texto.index("\n" + corte) + 1]
+    with pytest.raises(ValueError, match=f"Fim do arquivo: seção '{corte}'"):
+        list(ler_taillard(io.StringIO(texto)))
+
+def test_numeros_faltando():
+    texto = _taillard(3, 2, 1).rsplit("\n", 2)[0]
+    with pytest.raises(ValueError, match="Fim do arquivo: esperados 6 números"):
+        list(ler_taillard(io.StringIO(texto)))
+    with pytest.raises(ValueError, match="Fim do arquivo"):
+        list(ler_orlib(io.StringIO("2 2\n0 3 1 2\n")))
@@ -0,0 +1,27 @@
+import pytest
+from jobshop.busca_local import tempera_simulada
+from jobshop.cronograma import cronograma_aleatorio
+from jobshop.orcamento import Orcamento
+from jobshop.perfil import Perfil
+from jobshop.problema import como_problema, gerar_problema_aleatorio
+
+
+@pytest.mark.parametrize("max_avaliacoes", [20, 2000])
+@pytest.mark.parametrize("incremental", [True, False])
+def test_perfil_da_tempera_conta_todas_as_avaliacoes(max_avaliacoes, incremental):
+    problema = como_problema(gerar_problema_aleatorio(6, 4, 0))
+    orcamento = Orcamento(max_avaliacoes=max_avaliacoes)
+    perfil = Perfil()
+    tempera_simulada(problema, cronograma_aleatorio(problema, 0), incremental=incremental,
+                     orcamento=orcamento, semente=0, perfil=perfil)
+    contadores = perfil.contadores
+
+    # A calibração da temperatura inicial também gasta o orçamento e entra no perfil
+    assert contadores["amostras_calibracao"] == min(50, max_avaliacoes)
+    avaliados = contadores["aceitos"] + contadores["rejeitados"] + contadores["amostras_calibracao"]
+    assert avaliados == orcamento.avaliacoes == max_avaliacoes
+    assert contadores["vizinhos"] - contadores["descartados_estimativa"] == avaliados
+    if incremental:
+        assert contadores["avaliacoes_incrementais"] == avaliados
+    else:
+        assert contadores["decodificacoes"] >= 1 + avaliados
@@ -0,0 +1,22 @@
+from jobshop.cronograma import decodificar_individuo_simples, makespan_populacao
+from jobshop.genetico import pop_ini_jobshop
+from jobshop.problema import como_problema, gerar_problema_aleatorio
+
+# (jobs, máquinas): inclui um job só e uma máquina só
+TAMANHOS = [(1, 1), (1, 5), (6, 1), (3, 3), (10, 5), (15, 10)]
+
+
+def test_makespan_populacao_igual_ao_decodificador_escalar():
+    for n_jobs, n_maquinas in TAMANHOS:
+        for semente in range(3):
+            problema = como_problema(gerar_problema_aleatorio(n_jobs, n_maquinas, semente))
+            pop = pop_ini_jobshop(problema, 25, semente)
+            esperado = [decodificar_individuo_simples(ind, problema, makespan_only=True) for ind in pop]
+            assert makespan_populacao(pop, problema).tolist() == esperado, (n_jobs, n_maquinas, semente)
+
+def test_makespan_populacao_vazia_e_de_um_individuo():
+    problema = como_problema(gerar_problema_aleatorio(4, 3, 0))
+    individuo = pop_ini_jobshop(problema, 1, 0)[0]
+    cronograma = decodificar_individuo_simples(individuo, problema)
+    assert makespan_populacao([], problema).tolist() == []
+    assert makespan_populacao([individuo], problema).tolist() == [max(op["Fim"] for op in cronograma)]
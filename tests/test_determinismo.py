@@ -0,0 +1,53 @@
+from jobshop.busca_local import busca_tabu, tempera_simulada
+from jobshop.cronograma import cronograma_aleatorio
+from jobshop.genetico import algoritmo_genetico_simples
+from jobshop.ilhas import algoritmo_genetico_ilhas
+from jobshop.paralelo import encerrar_pool
+from jobshop.portfolio import portfolio_multi_inicio
+from jobshop.problema import como_problema, gerar_problema_aleatorio
+
+PROBLEMA = como_problema(gerar_problema_aleatorio(8, 5, 7))
+SEMENTE = 11
+
+
+def teardown_module():
+    encerrar_pool()
+
+def _rodar_duas_vezes(funcao, **kwargs):
+    primeira = funcao(PROBLEMA, semente=SEMENTE, **kwargs)
+    segunda = funcao(PROBLEMA, semente=SEMENTE, **kwargs)
+    return primeira, segunda
+
+
+def test_buscas_locais_repetem_com_a_mesma_semente():
+    inicial = cronograma_aleatorio(PROBLEMA, SEMENTE)
+    for busca, parametros in ((tempera_simulada, {"max_avaliacoes": 3000}), (busca_tabu, {"max_iteracoes": 100})):
+        primeira = busca(PROBLEMA, inicial, semente=SEMENTE, **parametros)
+        segunda = busca(PROBLEMA, inicial, semente=SEMENTE, **parametros)
+        assert primeira == segunda, busca.__name__
+
+def test_ag_repete_em_serie_e_em_paralelo():
+    serie, de_novo = _rodar_duas_vezes(algoritmo_genetico_simples, tp=40, ng=15, workers=1)
+    paralelo = algoritmo_genetico_simples(PROBLEMA, tp=40, ng=15, workers=2, semente=SEMENTE)
+    # (cronograma, makespan, historico); as estatísticas trazem contadores do cache
+    assert serie[:3] == de_novo[:3] == paralelo[:3]
+
+def test_ilhas_repetem_em_serie_e_em_paralelo():
+    serie, de_novo = _rodar_duas_vezes(algoritmo_genetico_ilhas, n_ilhas=3, tp=20, ng=12, intervalo_migracao=4, workers=1)
+    paralelo = algoritmo_genetico_ilhas(PROBLEMA, n_ilhas=3, tp=20, ng=12, intervalo_migracao=4, workers=2,
+                                        semente=SEMENTE)
+    assert serie[:3] == de_novo[:3] == paralelo[:3]
+    assert serie[3]["historicos_ilhas"] == paralelo[3]["historicos_ilhas"]
+
+def test_portfolio_repete_em_serie_e_em_paralelo():
+    # alvo=0 nunca é atingido: todos os reinícios rodam até o fim do orçamento
+    parametros = {"tempera": {"max_avaliacoes": 2000}, "tabu": {"max_iteracoes": 60}}
+    kwargs = dict(metodos=("tempera", "tabu"), reinicios=3, parametros=parametros, alvo=0)
+    serie, de_novo = _rodar_duas_vezes(portfolio_multi_inicio, workers=1, **kwargs)
+    paralelo = portfolio_multi_inicio(PROBLEMA, workers=2, semente=SEMENTE, **kwargs)
+
+    def resumo(resultado):
+        cronograma, makespan, execucoes = resultado
+        return cronograma, makespan, [(e["metodo"], e["semente"], e["makespan"], e["cronograma"]) for e in execucoes]
+
+    assert resumo(serie) == resumo(de_novo) == resumo(paralelo)
@@ -0,0 +1,55 @@
+import numpy as np
+from jobshop.cronograma import makespan_populacao
+from jobshop.genetico import _evoluir, _manter_jobs, _novo_estado, cruzamento_jox, cruzamento_pox
+from jobshop.problema import como_problema, gerar_problema_aleatorio
+
+# (jobs, máquinas): inclui um job só e uma máquina só
+TAMANHOS = [(1, 4), (5, 1), (2, 2), (6, 4)]
+
+
+def _pais(problema, n, rng):
+    base = np.tile(problema.job_op, (n, 1))
+    return rng.permuted(base, axis=1), rng.permuted(base, axis=1)
+
+def _validos(problema, pop):
+    # Cada job aparece exatamente n_ops vezes em cada linha
+    contagem = np.stack([np.bincount(linha, minlength=problema.n_jobs) for linha in np.asarray(pop)])
+    return contagem.shape[1] == problema.n_jobs and bool((contagem == problema.n_ops).all())
+
+
+def test_manter_jobs_gera_filhos_validos():
+    rng = np.random.default_rng(0)
+    for n_jobs, n_maquinas in TAMANHOS:
+        problema = como_problema(gerar_problema_aleatorio(n_jobs, n_maquinas, 0))
+        pais1, pais2 = _pais(problema, 9, rng)
+        linhas = np.arange(9)[:, None]
+        for manter in (rng.random((9, n_jobs)) < 0.5, np.zeros((9, n_jobs), bool), np.ones((9, n_jobs), bool)):
+            filhos = _manter_jobs(pais1, pais2, manter, linhas)
+            assert _validos(problema, filhos)
+            # Os genes dos jobs mantidos ficam nas posições do primeiro pai
+            fica = manter[linhas, pais1]
+            assert np.array_equal(filhos[fica], pais1[fica])
+
+def test_jox_e_pox_geram_filhos_validos():
+    rng = np.random.default_rng(1)
+    for n_jobs, n_maquinas in TAMANHOS:
+        problema = como_problema(gerar_problema_aleatorio(n_jobs, n_maquinas, 1))
+        for n in (1, 7):
+            pais1, pais2 = _pais(problema, n, rng)
+            for cruzar in (cruzamento_jox, cruzamento_pox):
+                filhos1, filhos2 = cruzar(pais1, pais2, rng)
+                assert _validos(problema, filhos1) and _validos(problema, filhos2), (cruzar.__name__, n_jobs, n)
+
+def test_geracoes_com_tp_impar_mantem_populacao_valida():
+    problema = como_problema(gerar_problema_aleatorio(6, 4, 2))
+    avaliar = lambda pop: makespan_populacao(pop, problema)
+    # O ponto único não preserva a contagem de cada job; só JOX e POX entram aqui
+    for cruzamento in ("jox", "pox"):
+        for tc in (0.0, 1.0):
+            tp = 9
+            estado = _novo_estado(problema, tp, np.random.default_rng(3))
+            _evoluir(estado, problema, 5, avaliar, tp, tc, 0.2, 0.2, "roleta", cruzamento)
+            assert estado["pop"].shape == (tp, problema.total_ops)
+            assert _validos(problema, estado["pop"]), (cruzamento, tc)
+            # Os makespans que acompanham a população são os dela
+            assert np.array_equal(estado["makespans"], avaliar(estado["pop"]))
@@ -0,0 +1,86 @@
+import numpy as np
+from jobshop.cronograma import cronograma_aleatorio, sequencia_do_cronograma
+from jobshop.grafo import AvaliadorIncremental, INVIAVEL, decodificar_sequencia
+from jobshop.problema import Problema, como_problema, gerar_problema_aleatorio
+from jobshop.vizinhanca import Insercao, SequenciaMaquinas, Troca
+
+# (jobs, máquinas): inclui um job só e uma máquina só
+TAMANHOS = [(1, 4), (5, 1), (2, 2), (4, 3), (6, 5), (8, 4)]
+SEMENTES = range(5)
+MOVIMENTOS = 60
+
+
+def _instancias():
+    for n_jobs, n_maquinas in TAMANHOS:
+        for semente in SEMENTES:
+            problema = como_problema(gerar_problema_aleatorio(n_jobs, n_maquinas, semente))
+            sequencia = sequencia_do_cronograma(problema, cronograma_aleatorio(problema, semente))
+            yield problema, sequencia, np.random.default_rng(semente)
+
+def _sortear_movimento(sequencia, rng):
+    maquina = int(rng.integers(len(sequencia)))
+    n = sequencia.tamanho(maquina)
+    if n < 2:
+        return Troca(maquina, 0, 0)
+    a, b = rng.choice(n, 2, replace=False).tolist()
+    return Troca(maquina, a, b) if rng.random() < 0.5 else Insercao(maquina, a, b)
+
+def _estado(avaliador):
+    return (avaliador.makespan, list(avaliador.cabeca), list(avaliador.cauda), list(avaliador.ordem),
+            list(avaliador.pos), list(avaliador.pm), list(avaliador.sm), avaliador.sequencia.ops.tolist())
+
+def _makespan_completo(problema, sequencia):
+    return decodificar_sequencia(problema, sequencia.copy(), makespan_only=True, reparar=False)
+
+
+def test_aplicar_igual_a_decodificacao_completa():
+    for problema, sequencia, rng in _instancias():
+        avaliador = AvaliadorIncremental(problema, sequencia)
+        for _ in range(MOVIMENTOS):
+            movimento = _sortear_movimento(sequencia, rng)
+            depois = sequencia.copy()
+            movimento.aplicar(depois)
+            esperado = _makespan_completo(problema, depois)
+
+            makespan = avaliador.aplicar(movimento)
+            assert makespan == esperado, movimento
+            if makespan is INVIAVEL:
+                continue
+            # Cabeças e caudas também batem com as de um avaliador construído do zero
+            novo = AvaliadorIncremental(problema, sequencia.copy())
+            assert avaliador.cabeca == novo.cabeca
+            assert avaliador.cauda == novo.cauda
+            if rng.random() < 0.5:
+                avaliador.desfazer()
+
+def test_desfazer_restaura_o_estado():
+    for problema, sequencia, rng in _instancias():
+        avaliador = AvaliadorIncremental(problema, sequencia)
+        for _ in range(MOVIMENTOS):
+            antes = _estado(avaliador)
+            avaliador.aplicar(_sortear_movimento(sequencia, rng))
+            avaliador.desfazer()
+            assert _estado(avaliador) == antes
+
+def test_estimativa_nao_passa_do_makespan():
+    for problema, sequencia, rng in _instancias():
+        avaliador = AvaliadorIncremental(problema, sequencia)
+        for _ in range(MOVIMENTOS):
+            movimento = _sortear_movimento(sequencia, rng)
+            estimativa = avaliador.estimativa(movimento)
+            makespan = avaliador.aplicar(movimento)
+            if makespan is not INVIAVEL:
+                assert estimativa <= makespan, movimento
+                avaliador.desfazer()
+
+def test_movimento_com_ciclo_retorna_inviavel():
+    # J1 usa M1 e depois M2; J2 usa M2 e depois M1. Operações: 0, 1 (J1) e 2, 3 (J2)
+    problema = Problema(np.array([[0, 1], [1, 0]]), np.array([[2, 3], [4, 1]]))
+    sequencia = SequenciaMaquinas.de_listas([[3, 0], [2, 1]])
+    avaliador = AvaliadorIncremental(problema, sequencia)
+    antes = _estado(avaliador)
+    assert avaliador.makespan == _makespan_completo(problema, sequencia)
+
+    # Em M2, a segunda operação de J1 passaria à frente da primeira de J2: 1 -> 2 -> 3 -> 0 -> 1
+    assert avaliador.aplicar(Troca(1, 0, 1)) is INVIAVEL
+    assert _estado(avaliador) == antes
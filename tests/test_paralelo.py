@@ -0,0 +1,33 @@
+import numpy as np
+from jobshop import paralelo
+from jobshop.cronograma import makespan_populacao
+from jobshop.genetico import pop_ini_jobshop
+from jobshop.problema import como_problema, gerar_problema_aleatorio
+
+
+def teardown_module():
+    paralelo.encerrar_pool()
+
+
+def test_makespan_populacao_paralelo_igual_a_serial():
+    # Um job só, uma máquina só e um caso comum; tamanhos que não dividem igualmente entre os workers
+    for n_jobs, n_maquinas in [(1, 4), (6, 1), (8, 5)]:
+        problema = como_problema(gerar_problema_aleatorio(n_jobs, n_maquinas, 0))
+        for tp in (1, 3, 4, 7, 31):
+            pop = pop_ini_jobshop(problema, tp, tp)
+            serial = makespan_populacao(pop, problema)
+            assert np.array_equal(paralelo.makespan_populacao_paralelo(pop, problema, 2), serial), (n_jobs, n_maquinas, tp)
+
+def test_pool_reservado_sobrevive_a_outros_problemas():
+    problema = como_problema(gerar_problema_aleatorio(5, 3, 0))
+    pop = pop_ini_jobshop(problema, 10, 0)
+    with paralelo.usar_pool(problema, 2) as pool:
+        # Mais problemas do que MAX_POOLS: só os pools ociosos podem ser encerrados
+        for semente in range(1, paralelo.MAX_POOLS + 2):
+            outro = como_problema(gerar_problema_aleatorio(5, 3, semente))
+            with paralelo.usar_pool(outro, 2):
+                pass
+        blocos = np.array_split(np.asarray(pop, dtype=np.int32), 2)
+        resultado = np.concatenate(list(pool.map(paralelo._avaliar_bloco, blocos)))
+    assert np.array_equal(resultado, makespan_populacao(pop, problema))
+    assert len(paralelo._pools) <= paralelo.MAX_POOLS